@@ -0,0 +1,48 @@
+# Benchmark: CompletionIndex build time and per-keystroke completion latency.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_completion [--names 1000000]
+
+import argparse
+import random
+import string
+import time
+
+from src.services.completion import CompletionIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--names", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    letters = string.ascii_lowercase
+    names = [
+        "".join(rng.choice(letters) for _ in range(rng.randint(4, 12))) + f" {idx}"
+        for idx in range(args.names)
+    ]
+    weights = [rng.random() for _ in range(args.names)]
+
+    start = time.perf_counter()
+    index = CompletionIndex(zip(names, weights))
+    print(f"built index of {len(index)} names in {time.perf_counter() - start:.2f}s")
+
+    # Prefixes of 0-4 characters, as typed one keystroke at a time; short prefixes match the most names.
+    for length in range(5):
+        prefixes = ["".join(rng.choice(letters) for _ in range(length)) for _ in range(args.queries)]
+        timings = []
+        for prefix in prefixes:
+            begin = time.perf_counter()
+            index.complete(prefix, args.limit)
+            timings.append(time.perf_counter() - begin)
+        timings.sort()
+        p50 = timings[len(timings) // 2] * 1e6
+        p99 = timings[int(len(timings) * 0.99)] * 1e6
+        print(f"prefix length {length}: p50 {p50:7.1f} us   p99 {p99:7.1f} us   (limit={args.limit})")
+
+
+if __name__ == "__main__":
+    main()
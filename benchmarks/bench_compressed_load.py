@@ -0,0 +1,112 @@
+# Benchmark: load time and peak RSS of PlanetCatalogue.from_json for plain and compressed input.
+#
+# Each load runs in a fresh subprocess so peak RSS is measured per format. VmHWM from
+# /proc/self/status is used where available because ru_maxrss is inherited across fork()
+# on Linux and would report this (large) parent process instead.
+# "decompress-then-parse" is the old workflow (decompress fully in memory, then json.loads)
+# and is included for comparison.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_compressed_load [--planets 200000]
+
+import argparse
+import bz2
+import gzip
+import json
+import lzma
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PEAK_RSS_KIB = """
+def peak_rss_kib():
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+CHILD_FROM_JSON = PEAK_RSS_KIB + """
+import sys, time
+from src.services.catalogue import PlanetCatalogue
+start = time.perf_counter()
+PlanetCatalogue.from_json(sys.argv[1])
+print(time.perf_counter() - start, peak_rss_kib())
+"""
+
+CHILD_DECOMPRESS_THEN_PARSE = PEAK_RSS_KIB + """
+import gzip, json, sys, time
+from src.services.catalogue import PlanetCatalogue, _build_planet
+start = time.perf_counter()
+raw = json.loads(gzip.decompress(open(sys.argv[1], "rb").read()))
+PlanetCatalogue([_build_planet(item, idx, sys.argv[1]) for idx, item in enumerate(raw)])
+print(time.perf_counter() - start, peak_rss_kib())
+"""
+
+
+def synthetic_planets(count: int) -> list:
+    """
+    Return 'count' synthetic planet dicts with unique names.
+    """
+    return [
+        {
+            "name": f"Body {idx}",
+            "mass_kg": 1.0e20 + idx,
+            "distance_from_sun_km": 1.0e8 + idx,
+            "moons": [f"Moon {idx}-{m}" for m in range(idx % 4)],
+        }
+        for idx in range(count)
+    ]
+
+
+def run_child(code: str, path: Path) -> tuple[float, int]:
+    """
+    Run a loader snippet in a fresh interpreter and return (seconds, peak RSS in KiB).
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", code, str(path)], check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--planets", type=int, default=200000)
+    args = parser.parse_args()
+
+    planets = synthetic_planets(args.planets)
+    array_bytes = json.dumps(planets).encode("utf-8")
+    lines_bytes = "\n".join(json.dumps(item) for item in planets).encode("utf-8")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = Path(tmpdir)
+        files = {
+            "planets.json": array_bytes,
+            "planets.json.gz": gzip.compress(array_bytes),
+            "planets.json.bz2": bz2.compress(array_bytes),
+            "planets.json.xz": lzma.compress(array_bytes),
+            "planets.jsonl.xz": lzma.compress(lines_bytes),
+        }
+        for name, data in files.items():
+            (directory / name).write_bytes(data)
+
+        print(f"{args.planets} planets, {len(array_bytes) / 1e6:.1f} MB uncompressed JSON")
+        print(f"{'input':<40}{'size MB':>10}{'load s':>10}{'peak RSS MB':>14}")
+
+        for name, data in files.items():
+            seconds, rss_kib = run_child(CHILD_FROM_JSON, directory / name)
+            print(f"{name:<40}{len(data) / 1e6:>10.1f}{seconds:>10.2f}{rss_kib / 1024:>14.1f}")
+
+        seconds, rss_kib = run_child(CHILD_DECOMPRESS_THEN_PARSE, directory / "planets.json.gz")
+        label = "planets.json.gz (decompress-then-parse)"
+        print(f"{label:<40}{len(files['planets.json.gz']) / 1e6:>10.1f}{seconds:>10.2f}{rss_kib / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
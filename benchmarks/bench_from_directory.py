@@ -0,0 +1,67 @@
+# Benchmark: PlanetCatalogue.from_directory with 1 worker versus N workers.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_from_directory [--files 200] [--per-file 2000] [--workers 2 4 8]
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.catalogue import PlanetCatalogue
+
+
+def write_shards(directory: Path, files: int, per_file: int) -> None:
+    """
+    Write 'files' JSON shards of 'per_file' synthetic planets each, with unique names.
+    """
+    for file_idx in range(files):
+        planets = [
+            {
+                "name": f"Body {file_idx}-{idx}",
+                "mass_kg": 1.0e20 + idx,
+                "distance_from_sun_km": 1.0e8 + file_idx,
+                "moons": [f"Moon {file_idx}-{idx}-{m}" for m in range(idx % 4)],
+            }
+            for idx in range(per_file)
+        ]
+        (directory / f"shard_{file_idx:04d}.json").write_text(json.dumps(planets), encoding="utf-8")
+
+
+def time_load(directory: Path, workers: int, repeats: int) -> float:
+    """
+    Return the best wall-clock time (seconds) over 'repeats' loads.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        PlanetCatalogue.from_directory(directory, max_workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--per-file", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = Path(tmpdir)
+        write_shards(directory, args.files, args.per_file)
+        print(f"{args.files} files x {args.per_file} planets")
+
+        baseline = time_load(directory, 1, args.repeats)
+        print(f"workers=1: {baseline:.3f}s")
+
+        for workers in sorted(set(args.workers) - {1}):
+            elapsed = time_load(directory, workers, args.repeats)
+            print(f"workers={workers}: {elapsed:.3f}s (x{baseline / elapsed:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Benchmark: CLI cold start - import time of src.main (python -X importtime) and time to first prompt.
+#
+# Also checks that modules only some features need are not imported at startup.
+# Pass --max-import-ms / --max-prompt-ms to fail (exit status 1) on a regression.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_startup [--runs 10] [--max-import-ms 80] [--max-prompt-ms 250]
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Imported on first use (suggestions, directory loading, tabular loaders, shared memory, diagnostics).
+LAZY_MODULES = ["difflib", "concurrent.futures", "mmap", "multiprocessing", "src.services.tabular_loader", "tracemalloc"]
+
+PROMPT = b"Choose an option"
+
+
+def import_times() -> Dict[str, int]:
+    """
+    Import src.main in a fresh interpreter and return module -> cumulative import time (us).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True, text=True, check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def time_to_prompt() -> float:
+    """
+    Start the CLI and return the seconds until the first menu prompt is printed.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.main"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+    )
+    output = b""
+    while PROMPT not in output:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError("src.main exited before showing the menu")
+        output += chunk
+    elapsed = time.perf_counter() - start
+
+    process.communicate(b"0\n")
+    return elapsed
+
+
+def eager_lazy_modules() -> List[str]:
+    """
+    Return the LAZY_MODULES that "import src.main" imported anyway.
+    """
+    check = f"import sys, src.main; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CLI import time and time to first prompt.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-prompt-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    runs: List[Dict[str, int]] = [import_times() for _ in range(args.runs)]
+    import_ms = statistics.median(times["src.main"] for times in runs) / 1000
+    print(f"import src.main: median {import_ms:.1f} ms over {args.runs} runs")
+
+    slowest: List[Tuple[int, str]] = sorted(((us, name) for name, us in runs[-1].items() if name != "src.main"), reverse=True)
+    for us, name in slowest[:args.top]:
+        print(f"  {us / 1000:7.1f} ms  {name}")
+
+    prompt_ms = statistics.median(time_to_prompt() for _ in range(args.runs)) * 1000
+    print(f"time to first prompt (including interpreter start): median {prompt_ms:.1f} ms")
+
+    failures: List[str] = []
+    eager = eager_lazy_modules()
+    if eager:
+        failures.append(f"imported at startup but should be lazy: {', '.join(eager)}")
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import time {import_ms:.1f} ms exceeds {args.max_import_ms} ms")
+    if args.max_prompt_ms is not None and prompt_ms > args.max_prompt_ms:
+        failures.append(f"time to first prompt {prompt_ms:.1f} ms exceeds {args.max_prompt_ms} ms")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
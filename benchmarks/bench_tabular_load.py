@@ -0,0 +1,83 @@
+# Benchmark: memory-mapped fixed-width/CSV loading versus converting to JSON and using from_json.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_tabular_load [--rows 300000]
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.catalogue import PlanetCatalogue
+from src.services.tabular_loader import CsvSpec, FixedWidthSpec
+
+FIXED_SPEC = FixedWidthSpec(name=(0, 20), mass_kg=(20, 36), distance_from_sun_km=(36, 52), moons=(52, 80))
+CSV_SPEC = CsvSpec(name="name", mass_kg="mass_kg", distance_from_sun_km="distance_km", moons="moons")
+
+
+def write_inputs(directory: Path, rows: int) -> tuple[Path, Path]:
+    """
+    Write the same synthetic minor bodies as a fixed-width file and a CSV file.
+    """
+    fixed_lines = []
+    csv_lines = ["name,mass_kg,distance_km,moons"]
+    for idx in range(rows):
+        name = f"Asteroid {idx}"
+        mass = f"{1.0e15 + idx:.6e}"
+        distance = f"{3.0e8 + idx:.6e}"
+        moons = ";".join(f"S{idx}-{m}" for m in range(idx % 2))
+        fixed_lines.append(f"{name:<20}{mass:<16}{distance:<16}{moons:<28}")
+        csv_lines.append(f"{name},{mass},{distance},{moons}")
+
+    fixed_path = directory / "minor.txt"
+    csv_path = directory / "minor.csv"
+    fixed_path.write_text("\n".join(fixed_lines) + "\n", encoding="utf-8")
+    csv_path.write_text("\n".join(csv_lines) + "\n", encoding="utf-8")
+    return fixed_path, csv_path
+
+
+def convert_fixed_width_to_json(source: Path, target: Path) -> None:
+    """
+    The old workflow: read the text line by line and write the JSON that from_json expects.
+    """
+    planets = []
+    with source.open(encoding="utf-8") as handle:
+        for line in handle:
+            planets.append({
+                "name": line[0:20].strip(),
+                "mass_kg": float(line[20:36]),
+                "distance_from_sun_km": float(line[36:52]),
+                "moons": [moon for moon in line[52:80].strip().split(";") if moon],
+            })
+    target.write_text(json.dumps(planets), encoding="utf-8")
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"{label:<40}{time.perf_counter() - start:>8.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=300000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = Path(tmpdir)
+        fixed_path, csv_path = write_inputs(directory, args.rows)
+        json_path = directory / "minor.json"
+
+        print(f"{args.rows} rows")
+        timed("from_fixed_width (mmap)", lambda: PlanetCatalogue.from_fixed_width(fixed_path, FIXED_SPEC))
+        timed("from_csv (mmap)", lambda: PlanetCatalogue.from_csv(csv_path, CSV_SPEC))
+        timed("convert to JSON + from_json", lambda: (
+            convert_fixed_width_to_json(fixed_path, json_path),
+            PlanetCatalogue.from_json(json_path),
+        ))
+        timed("from_json only (already converted)", lambda: PlanetCatalogue.from_json(json_path))
+
+
+if __name__ == "__main__":
+    main()
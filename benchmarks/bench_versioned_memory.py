@@ -0,0 +1,91 @@
+# Benchmark: memory for 100 catalogue versions that each differ by about 1%.
+#
+# Compares VersionedCatalogue (structurally shared PersistentMap versions) with keeping
+# one full PlanetCatalogue per version. Memory is measured with tracemalloc, counting only
+# what is still allocated once all versions have been built.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_versioned_memory [--planets 10000] [--versions 100]
+
+import argparse
+import random
+import tracemalloc
+from typing import Callable, List
+
+from src.models.planet import Planet
+from src.services.catalogue import PlanetCatalogue
+from src.services.versioned_catalogue import VersionedCatalogue
+
+
+def make_planet(idx: int, revision: int) -> Planet:
+    """
+    Return a synthetic planet; a higher revision gives it a slightly different mass.
+    """
+    return Planet(
+        name=f"Body {idx}",
+        mass_kg=1.0e20 + idx + revision,
+        distance_from_sun_km=1.0e8 + idx,
+        moons=[f"Moon {idx}-{m}" for m in range(idx % 3)],
+    )
+
+
+def releases(planets: int, versions: int, change_ratio: float) -> List[List[int]]:
+    """
+    Return, for each version, the indexes of planets changed in that version.
+    """
+    rng = random.Random(2019)
+    changed_per_version = max(1, int(planets * change_ratio))
+    return [rng.sample(range(planets), changed_per_version) for _ in range(versions)]
+
+
+def measure(build: Callable[[], object]) -> int:
+    """
+    Return the bytes still allocated by build()'s result (the result is kept alive while measuring).
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--planets", type=int, default=10000)
+    parser.add_argument("--versions", type=int, default=100)
+    parser.add_argument("--change-ratio", type=float, default=0.01)
+    args = parser.parse_args()
+
+    changes = releases(args.planets, args.versions, args.change_ratio)
+
+    def build_versioned() -> VersionedCatalogue:
+        versions = VersionedCatalogue()
+        versions.commit("v0", [make_planet(idx, 0) for idx in range(args.planets)])
+        for number, changed in enumerate(changes, start=1):
+            versions.commit(f"v{number}", [make_planet(idx, number) for idx in changed])
+        return versions
+
+    def build_full_copies() -> List[PlanetCatalogue]:
+        current = [make_planet(idx, 0) for idx in range(args.planets)]
+        catalogues = [PlanetCatalogue(current)]
+        for number, changed in enumerate(changes, start=1):
+            current = list(current)
+            for idx in changed:
+                current[idx] = make_planet(idx, number)
+            catalogues.append(PlanetCatalogue(current))
+        return catalogues
+
+    single = measure(lambda: PlanetCatalogue([make_planet(idx, 0) for idx in range(args.planets)]))
+    versioned = measure(build_versioned)
+    full = measure(build_full_copies)
+
+    print(f"{args.planets} planets, {args.versions} versions, {args.change_ratio:.0%} changed per version")
+    print(f"single catalogue:                {single / 1e6:8.1f} MB")
+    print(f"full PlanetCatalogue per version:{full / 1e6:8.1f} MB")
+    print(f"VersionedCatalogue:              {versioned / 1e6:8.1f} MB ({full / versioned:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
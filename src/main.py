@@ -1,5 +1,8 @@
 # External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
 
+import threading
+from typing import Callable, List, Optional
+
 from src.services.catalogue import PlanetCatalogue
 from src.services.formatter import (
     format_planet_details,
@@ -10,6 +13,39 @@ from src.services.formatter import (
 from src.services.query_parser import QueryEngine
 from src.utils.errors import PlanetError, PlanetNotFoundError
 
+DATA_PATH = "data/planets.json"
+
+
+class CatalogueLoader:
+    """
+    Builds the catalogue on a background thread so the menu can be shown straight away.
+
+    result() waits for the build to finish (usually it already has by the time a user
+    picks an option) and re-raises any error from loading in the calling thread.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._catalogue: Optional[PlanetCatalogue] = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._load, name="catalogue-loader", daemon=True)
+        self._thread.start()
+
+    def _load(self) -> None:
+        try:
+            self._catalogue = PlanetCatalogue.from_json(self._path)
+        except BaseException as exc:  # handed to whichever thread calls result()
+            self._error = exc
+
+    def result(self) -> PlanetCatalogue:
+        """
+        Return the loaded catalogue, waiting for the background build if needed.
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._catalogue
+
 
 def prompt(text: str) -> str:
     """
@@ -35,6 +71,58 @@ def prompt_non_empty(text: str) -> str:
             return value
         print("Please enter a value.")
 
+
+def prompt_planet_name(text: str, catalogue: PlanetCatalogue) -> str:
+    """
+    Prompt for a planet name with Tab completion from the catalogue (where readline is available).
+
+    Completion is only active during this prompt, so menu choices and free-text
+    questions are not completed.
+    """
+    restore = enable_name_completion(catalogue)
+    try:
+        return prompt_non_empty(text)
+    finally:
+        if restore is not None:
+            restore()
+
+
+def enable_name_completion(catalogue: PlanetCatalogue) -> Optional[Callable[[], None]]:
+    """
+    Install a readline completer that completes the whole input line to a planet name.
+
+    Returns a function that puts back the previous completer and word delimiters, or None
+    if readline is not available (e.g. on Windows), in which case prompts simply work
+    without completion.
+    """
+    try:
+        import readline
+    except ImportError:
+        return None
+
+    matches: List[str] = []
+
+    def complete(text: str, state: int) -> Optional[str]:
+        # readline calls this with state 0, 1, 2... until it returns None.
+        if state == 0:
+            matches[:] = catalogue.complete(readline.get_line_buffer(), limit=10)
+        return matches[state] if state < len(matches) else None
+
+    previous_completer = readline.get_completer()
+    previous_delims = readline.get_completer_delims()
+
+    def restore() -> None:
+        readline.set_completer(previous_completer)
+        readline.set_completer_delims(previous_delims)
+
+    readline.set_completer_delims("")  # complete the whole line, so multi-word names work
+    readline.set_completer(complete)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")  # macOS ships libedit, which uses its own syntax
+    else:
+        readline.parse_and_bind("tab: complete")
+    return restore
+
 #--------------------------------------------------------------
 
 def print_result(text: str) -> None:
@@ -94,6 +182,9 @@ def normalise_menu_choice(raw: str) -> str:
     if value in ["ask", "question", "query", "free text"]:
         return "7"
 
+    if value in ["memory", "diagnostics", "profile"]:
+        return "8"
+
     return "invalid"
 
 
@@ -109,6 +200,7 @@ def show_menu() -> None:
     print("5) Moon count")
     print("6) Check if a name is a planet in the list")
     print("7) Ask a question")
+    print("8) Memory diagnostics")
     print("0) Exit")
 
 
@@ -116,18 +208,13 @@ def main() -> None:
     """
     Run the command-line menu program.
 
-    Loads the planet data from JSON, then repeatedly:
-    - shows the menu
+    Starts loading the planet data from JSON in the background, then repeatedly:
+    - shows the menu (without waiting for the data)
     - reads and normalises a user choice
     - performs the requested action (including free-text questions via QueryEngine)
     Handles common errors and keeps running until the user exits.
     """
-    try:
-        catalogue = PlanetCatalogue.from_json("data/planets.json")
-    except PlanetError as exc:
-        print(f"Error loading data: {exc}")
-        return
-
+    loader = CatalogueLoader(DATA_PATH)
     engine = QueryEngine()
 
     while True:
@@ -148,32 +235,38 @@ def main() -> None:
             print("Invalid option. Choose a number from the menu, or type a keyword like 'list'.")
             continue
 
+        try:
+            catalogue = loader.result()
+        except PlanetError as exc:
+            print(f"Error loading data: {exc}")
+            return
+
         try:
             if choice == "1":
                 print("Planets:", ", ".join(catalogue.all_names()))
 
             elif choice == "2":
-                name = prompt_non_empty("Enter planet name: ")
+                name = prompt_planet_name("Enter planet name: ", catalogue)
                 planet = catalogue.get(name)
                 print(format_planet_details(planet))
 
             elif choice == "3":
-                name = prompt_non_empty("Enter planet name: ")
+                name = prompt_planet_name("Enter planet name: ", catalogue)
                 planet = catalogue.get(name)
                 print(format_planet_mass(planet))
 
             elif choice == "4":
-                name = prompt_non_empty("Enter planet name: ")
+                name = prompt_planet_name("Enter planet name: ", catalogue)
                 planet = catalogue.get(name)
                 print(format_planet_distance(planet))
 
             elif choice == "5":
-                name = prompt_non_empty("Enter planet name: ")
+                name = prompt_planet_name("Enter planet name: ", catalogue)
                 planet = catalogue.get(name)
                 print(format_planet_moon_count(planet))
 
             elif choice == "6":
-                name = prompt_non_empty("Enter name to check: ")
+                name = prompt_planet_name("Enter name to check: ", catalogue)
                 if catalogue.exists(name):
                     print(f"Yes, {name.strip()} is in the planet list.")
                 else:
@@ -184,6 +277,14 @@ def main() -> None:
                 answer = engine.answer(question, catalogue)
                 print_result(answer)
 
+            elif choice == "8":
+                # Opt-in: tracemalloc only runs while the report is built.
+                from src.services.diagnostics import DEFAULT_QUESTIONS, build_report, format_report
+
+                question = prompt("Question to profile (leave blank for the built-in set): ")
+                report = build_report(DATA_PATH, [question] if question else DEFAULT_QUESTIONS)
+                print(format_report(report))
+
             else:
                 print("Invalid option. Choose a number from the menu, or type a keyword like 'list'.")
 
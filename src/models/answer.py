@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from src.models.planet import Planet
+
+
+class Intent(str, Enum):
+    """
+    Represents the supported question types (intents) the QueryEngine can recognise.
+
+    Each value is a simple label used to route the question to the correct answer logic.
+    """
+    DETAILS = "details"
+    MASS = "mass"
+    DISTANCE = "distance"
+    MOON_COUNT = "moon_count"
+    MOON_LIST = "moon_list"
+    MEMBERSHIP = "membership"
+    PLANET_COUNT = "planet_count"
+    TOTAL_MOONS = "total_moons"
+    NO_MOONS = "no_moons"
+    AVERAGE_MASS = "average_mass"
+    AVERAGE_DISTANCE = "average_distance"
+    TOTAL_MASS = "total_mass"
+    TOTAL_DISTANCE = "total_distance"
+    MASS_DISTRIBUTION = "mass_distribution"
+    DISTANCE_DISTRIBUTION = "distance_distribution"
+    MOON_DISTRIBUTION = "moon_distribution"
+    MOST_MASSIVE = "most_massive"
+    LEAST_MASSIVE = "least_massive"
+    CLOSEST = "closest"
+    FARTHEST = "farthest"
+    UNKNOWN = "unknown"
+
+
+class AnswerStatus(str, Enum):
+    """
+    Represents how a question was resolved, independent of what was asked (the Intent).
+    """
+    OK = "ok"
+    EMPTY_QUESTION = "empty_question"
+    NAME_REQUIRED = "name_required"
+    PLANET_NOT_FOUND = "planet_not_found"
+    UNKNOWN_QUESTION = "unknown_question"
+
+
+@dataclass(frozen=True, slots=True)
+class Answer:
+    """
+    A structured answer to a question, produced by QueryEngine.ask.
+
+    Fields:
+    - status: how the question was resolved (see AnswerStatus)
+    - intent: what the question asked for (see Intent)
+    - planet: the Planet the answer is about, if one was identified
+    - values: the raw values behind the answer (e.g. {"mass_kg": 6.417e23})
+    - suggestions: close planet-name matches when a name was not recognised
+
+    No text is built until render() is called, so machine consumers can read
+    the values (or call to_json) without paying for string formatting.
+    """
+    status: AnswerStatus
+    intent: Intent
+    planet: Optional[Planet] = None
+    values: Dict[str, Any] = field(default_factory=dict)
+    suggestions: List[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        """
+        Return the human-readable text for this answer (the same text QueryEngine.answer returns).
+        """
+        from src.services.formatter import format_answer  # imported here because formatter imports this module
+
+        return format_answer(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return a JSON-compatible dictionary; the planet is referenced by its name.
+        """
+        return {
+            "status": self.status.value,
+            "intent": self.intent.value,
+            "planet": self.planet.name if self.planet is not None else None,
+            "values": dict(self.values),
+            "suggestions": list(self.suggestions),
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialise the answer straight to a JSON string (no text rendering involved).
+        """
+        return json.dumps(self.to_dict())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+import sys
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -13,8 +15,8 @@ class Planet:
 
     Fields:
     - name: planet name (must be a non-empty string)
-    - mass_kg: mass in kilograms (must be a positive number)
-    - distance_from_sun_km: distance from the Sun in kilometres (must be a positive number)
+    - mass_kg: mass in kilograms (must be a positive, finite number)
+    - distance_from_sun_km: distance from the Sun in kilometres (must be a positive, finite number)
     - moons: list of moon names (each must be a non-empty string)
     """
     name: str
@@ -32,13 +34,8 @@ class Planet:
         if not isinstance(self.name, str) or not self.name.strip():
             raise DataValidationError("Planet name must be a non-empty string")
 
-        if not isinstance(self.mass_kg, (int, float)) or self.mass_kg <= 0:
-            raise DataValidationError(f"Mass must be a positive number. Got: {self.mass_kg}")
-
-        if not isinstance(self.distance_from_sun_km, (int, float)) or self.distance_from_sun_km <= 0:
-            raise DataValidationError(
-                f"Distance from sun must be a positive number. Got: {self.distance_from_sun_km}"
-            )
+        _check_positive_number(self.mass_kg, "Mass")
+        _check_positive_number(self.distance_from_sun_km, "Distance from sun")
 
         if not isinstance(self.moons, list):
             raise DataValidationError("Moons must be a list of strings")
@@ -52,3 +49,23 @@ class Planet:
         Return the number of moons orbiting the planet.
         """
         return len(self.moons)
+
+
+def _check_positive_number(value: object, label: str) -> None:
+    """
+    Raise DataValidationError unless value is a positive, finite number.
+
+    The value is converted with float() so that NaN and infinity are rejected (NaN would
+    otherwise pass "<= 0", since every comparison with NaN is False), and so is an integer
+    too large for a float, which the rest of the code could not compute with.
+    """
+    if not isinstance(value, (int, float)):
+        raise DataValidationError(f"{label} must be a positive number. Got: {value!r}")
+
+    try:
+        number = float(value)
+    except OverflowError:
+        raise DataValidationError(f"{label} is too large (more than {sys.float_info.max:.3e})") from None
+
+    if not math.isfinite(number) or number <= 0:
+        raise DataValidationError(f"{label} must be a positive number. Got: {value}")
@@ -0,0 +1,207 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import argparse
+import json
+import logging
+import multiprocessing
+import socket
+from multiprocessing.connection import wait
+from typing import List, Optional, Tuple
+
+from src.services.catalogue import PlanetCatalogue
+from src.services.query_parser import QueryEngine
+from src.services.shared_catalogue import SharedCatalogue
+from src.utils.errors import PlanetError
+
+logger = logging.getLogger(__name__)
+
+MAX_LINE = 4096  # bytes per question, newline included; a client that sends more is disconnected
+
+
+class PreforkServer:
+    """
+    A pre-forked question server that keeps one copy of the catalogue in shared memory.
+
+    The parent loads the catalogue, copies it into a SharedCatalogue segment, opens the
+    listening socket, and forks the workers. Each worker attaches to the segment
+    read-only and accepts connections on the shared socket, so memory per worker stays
+    roughly constant however many workers there are.
+
+    Protocol: one question per line (UTF-8); each reply is one line of JSON holding the
+    structured answer (Answer.to_dict) plus its rendered "text". A line longer than
+    MAX_LINE bytes gets an error reply and the connection is closed.
+    A failing connection only ends that connection; if a worker dies anyway,
+    serve_forever starts a replacement.
+    Requires the "fork" start method (Linux/macOS).
+    """
+
+    def __init__(self, catalogue: PlanetCatalogue, host: str = "127.0.0.1", port: int = 0, workers: int = 2) -> None:
+        self._shared = SharedCatalogue.create(catalogue)
+        self._socket = socket.create_server((host, port))
+        self._workers = workers
+        self._processes: List[multiprocessing.Process] = []
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """
+        The (host, port) the server is listening on (useful with port=0).
+        """
+        return self._socket.getsockname()[:2]
+
+    @property
+    def worker_pids(self) -> List[Optional[int]]:
+        """
+        Process ids of the running workers.
+        """
+        return [process.pid for process in self._processes]
+
+    def start(self) -> None:
+        """
+        Fork the worker processes; they start accepting connections immediately.
+        """
+        for _ in range(self._workers):
+            self._processes.append(self._spawn())
+
+    def restart_dead_workers(self) -> int:
+        """
+        Replace any worker process that has exited; return how many were restarted.
+        """
+        restarted = 0
+        for idx, process in enumerate(self._processes):
+            if not process.is_alive():
+                logger.warning("Worker %s exited with code %s; starting a replacement", process.pid, process.exitcode)
+                process.join()
+                self._processes[idx] = self._spawn()
+                restarted += 1
+        return restarted
+
+    def serve_forever(self) -> None:
+        """
+        Start the workers and supervise them until interrupted (Ctrl+C), then shut down.
+
+        Whenever a worker exits it is replaced, so the server keeps its full worker count.
+        """
+        self.start()
+        try:
+            while True:
+                wait([process.sentinel for process in self._processes])  # returns when any worker exits
+                self.restart_dead_workers()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """
+        Stop the workers, close the socket and destroy the shared memory segment.
+        """
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes.clear()
+
+        self._socket.close()
+        self._shared.close()
+        self._shared.unlink()
+
+    def _spawn(self) -> multiprocessing.Process:
+        """
+        Fork and start one worker process.
+        """
+        context = multiprocessing.get_context("fork")
+        process = context.Process(target=_worker_main, args=(self._socket, self._shared.name), daemon=True)
+        process.start()
+        return process
+
+
+def _worker_main(listener: socket.socket, shared_name: str) -> None:
+    """
+    Worker process: attach to the shared catalogue and answer connections until terminated.
+
+    Errors are contained per connection: a client that disconnects or resets mid-reply
+    (OSError) is simply dropped, and any other exception is logged, so one bad client
+    cannot take the worker down.
+    """
+    catalogue = SharedCatalogue.attach(shared_name)
+    engine = QueryEngine()
+
+    try:
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                continue  # e.g. the client reset the connection before it was accepted
+            try:
+                with connection:
+                    _handle_connection(connection, catalogue, engine)
+            except OSError:
+                pass  # client went away (broken pipe, connection reset)
+            except Exception:
+                logger.exception("Unexpected error while handling a connection")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        catalogue.close()
+
+
+def _handle_connection(connection: socket.socket, catalogue: SharedCatalogue, engine: QueryEngine) -> None:
+    """
+    Answer each line received on a connection until the client closes it.
+
+    Lines are read with a size limit, so a client that never sends a newline cannot
+    make the worker buffer an unbounded amount of data.
+    """
+    with connection.makefile("rwb") as stream:
+        while True:
+            raw = stream.readline(MAX_LINE + 1)
+            if raw == b"":
+                return
+
+            if len(raw) > MAX_LINE:
+                reply = {"status": "error", "text": f"Error: question is longer than {MAX_LINE} bytes"}
+                stream.write(json.dumps(reply).encode("utf-8") + b"\n")
+                stream.flush()
+                connection.shutdown(socket.SHUT_WR)  # send the reply before closing with unread data resets the connection
+                return
+
+            question = raw.decode("utf-8", errors="replace")
+            try:
+                answer = engine.ask(question, catalogue)  # SharedCatalogue offers the same lookup API
+                reply = answer.to_dict()
+                reply["text"] = answer.render()
+            except PlanetError as exc:
+                reply = {"status": "error", "text": f"Error: {exc}"}
+
+            stream.write(json.dumps(reply).encode("utf-8") + b"\n")
+            stream.flush()
+
+
+def main() -> None:
+    """
+    Run the pre-fork server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Serve planet questions from pre-forked workers.")
+    parser.add_argument("--data", default="data/planets.json", help="catalogue JSON file (may be compressed)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    try:
+        catalogue = PlanetCatalogue.from_json(args.data)
+    except PlanetError as exc:
+        print(f"Error loading data: {exc}")
+        return
+
+    server = PreforkServer(catalogue, args.host, args.port, args.workers)
+    del catalogue  # the workers only need the shared copy
+
+    host, port = server.address
+    print(f"Serving {args.workers} worker(s) on {host}:{port} (Ctrl+C to stop)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
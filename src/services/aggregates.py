@@ -0,0 +1,183 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import math
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.models.planet import Planet
+
+MASS = "mass_kg"
+DISTANCE = "distance_from_sun_km"
+MOONS = "moon_count"
+
+
+class _FieldStats:
+    """
+    Running statistics for one numeric planet field: sum, sorted values (for min/max) and a histogram.
+    """
+    __slots__ = ("total", "ordered", "histogram", "bucket")
+
+    def __init__(self, bucket: Callable[[float], int]) -> None:
+        self.total: float = 0  # stays an int for moon counts
+        self.ordered: List[Tuple[float, str]] = []  # (value, planet name), kept sorted
+        self.histogram: Counter = Counter()
+        self.bucket = bucket
+
+    def extend(self, pairs: List[Tuple[float, str]]) -> None:
+        """
+        Add many (value, name) pairs at once with a single sort (used for the initial build).
+        """
+        self.total += sum(value for value, _ in pairs)
+        self.ordered.extend(pairs)
+        self.ordered.sort()
+        self.histogram.update(self.bucket(value) for value, _ in pairs)
+
+    def add(self, value: float, name: str) -> None:
+        self.total += value
+        insort(self.ordered, (value, name))
+        self.histogram[self.bucket(value)] += 1
+
+    def remove(self, value: float, name: str) -> None:
+        self.total -= value
+        del self.ordered[bisect_left(self.ordered, (value, name))]
+        bucket = self.bucket(value)
+        self.histogram[bucket] -= 1
+        if self.histogram[bucket] == 0:
+            del self.histogram[bucket]
+
+
+def _decade(value: float) -> int:
+    """
+    Histogram bucket for masses and distances: the power of ten (e.g. 5.97e24 -> 24).
+    """
+    return math.floor(math.log10(value))
+
+
+def _exact(value: float) -> int:
+    """
+    Histogram bucket for moon counts: the count itself.
+    """
+    return int(value)
+
+
+class CatalogueAggregates:
+    """
+    Catalogue-wide statistics kept up to date as planets are added, removed or replaced.
+
+    Tracks, for mass, distance from the Sun and moon count: count, sum, mean, min/max
+    (with the planet that holds them) and a histogram (powers of ten for mass and distance,
+    exact counts for moons). Every read is O(1); each update costs O(log n) to find the
+    value's place plus a list insert, instead of a full pass over the catalogue.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._fields: Dict[str, _FieldStats] = {
+            MASS: _FieldStats(_decade),
+            DISTANCE: _FieldStats(_decade),
+            MOONS: _FieldStats(_exact),
+        }
+
+    @classmethod
+    def from_planets(cls, planets: Iterable[Planet]) -> "CatalogueAggregates":
+        """
+        Compute aggregates for a set of planets in one pass (one sort per field, not one insert per planet).
+        """
+        aggregates = cls()
+        columns: Dict[str, List[Tuple[float, str]]] = {field: [] for field in aggregates._fields}
+
+        for planet in planets:
+            aggregates._count += 1
+            for field, value in _values(planet):
+                columns[field].append((value, planet.name))
+
+        for field, pairs in columns.items():
+            aggregates._fields[field].extend(pairs)
+        return aggregates
+
+    def add(self, planet: Planet) -> None:
+        """
+        Include a planet in the statistics.
+        """
+        self._count += 1
+        for field, value in _values(planet):
+            self._fields[field].add(value, planet.name)
+
+    def remove(self, planet: Planet) -> None:
+        """
+        Remove a planet (previously added) from the statistics.
+        """
+        self._count -= 1
+        for field, value in _values(planet):
+            self._fields[field].remove(value, planet.name)
+        if self._count == 0:
+            for stats in self._fields.values():
+                stats.total = 0  # drop accumulated floating-point drift
+
+    def replace(self, old: Planet, new: Planet) -> None:
+        """
+        Swap one planet's values for another's (e.g. an updated record for the same planet).
+        """
+        self.remove(old)
+        self.add(new)
+
+    def count(self) -> int:
+        """
+        Number of planets.
+        """
+        return self._count
+
+    def total(self, field: str) -> float:
+        """
+        Sum of a field over all planets (e.g. total(MOONS) is the total number of moons).
+        """
+        return self._fields[field].total
+
+    def mean(self, field: str) -> Optional[float]:
+        """
+        Average of a field, or None if there are no planets.
+        """
+        if self._count == 0:
+            return None
+        return self._fields[field].total / self._count
+
+    def minimum(self, field: str) -> Optional[Tuple[float, str]]:
+        """
+        (smallest value, planet name) for a field, or None if there are no planets.
+        """
+        ordered = self._fields[field].ordered
+        return ordered[0] if ordered else None
+
+    def maximum(self, field: str) -> Optional[Tuple[float, str]]:
+        """
+        (largest value, planet name) for a field, or None if there are no planets.
+        """
+        ordered = self._fields[field].ordered
+        return ordered[-1] if ordered else None
+
+    def histogram(self, field: str) -> Dict[int, int]:
+        """
+        Bucket -> number of planets, sorted by bucket.
+
+        Buckets are powers of ten for mass and distance (24 means 1e24 <= value < 1e25)
+        and exact counts for moons.
+        """
+        return dict(sorted(self._fields[field].histogram.items()))
+
+    def planets_without_moons(self) -> int:
+        """
+        Number of planets with no moons.
+        """
+        return self._fields[MOONS].histogram.get(0, 0)
+
+
+def _values(planet: Planet) -> List[Tuple[str, float]]:
+    """
+    The (field, value) pairs tracked for a planet.
+    """
+    return [
+        (MASS, planet.mass_kg),
+        (DISTANCE, planet.distance_from_sun_km),
+        (MOONS, planet.moon_count()),
+    ]
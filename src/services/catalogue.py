@@ -1,14 +1,22 @@
 # External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
 
-import json
-import difflib
+import io
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, BinaryIO, Mapping, Optional
 
 from src.models.planet import Planet
-from src.utils.errors import DataValidationError, PlanetNotFoundError
+from src.services.aggregates import CatalogueAggregates
+from src.services.completion import CompletionIndex
+from src.utils.errors import DataValidationError, PlanetError, PlanetNotFoundError
+from src.utils.streams import iter_json_array, iter_json_lines, open_decompressed
 from src.utils.text import normalise_name
 
+if TYPE_CHECKING:
+    from src.services.tabular_loader import CsvSpec, FixedWidthSpec
+
+# Modules only some features need (difflib, concurrent.futures, mmap/tabular_loader) are
+# imported inside the methods that use them, to keep "import src.main" fast.
+
 
 class PlanetCatalogue:
     def __init__(self, planets: List[Planet]) -> None:
@@ -20,17 +28,40 @@ class PlanetCatalogue:
         so lookups are fast and case/spacing insensitive.
         """
         self._by_name: Dict[str, Planet] = {normalise_name(planet.name): planet for planet in planets}  # Dict[str, Planet] adding type hint for clarity
+        self._completion: Optional[CompletionIndex] = None  # built on first use by complete()
+        self._aggregates: Optional[CatalogueAggregates] = None  # computed on first use by aggregates()
+        self._max_name_words: Optional[int] = max((_word_count(key) for key in self._by_name), default=0)
 
         # self._by_name: Dict[str, Planet] = {}
         # for p in planets:
         #     key = normalise_name(p.name)
         #     self._by_name[key] = p
 
+    @classmethod
+    def _from_index(cls, index: Mapping[str, Planet]) -> "PlanetCatalogue":
+        """
+        Wrap an existing normalised-name -> Planet mapping without copying it.
+
+        Used by loaders that already built the index while checking for duplicate names,
+        and by VersionedCatalogue, whose versions are PersistentMap snapshots that must
+        stay shared rather than be rebuilt into a fresh dict.
+        """
+        catalogue = cls.__new__(cls)
+        catalogue._by_name = index
+        catalogue._completion = None
+        catalogue._max_name_words = None  # computed on first use, so versions are not rescanned
+        catalogue._aggregates = None  # computed on first use, so versions do not each hold a copy
+        return catalogue
+
     @classmethod
     def from_json(cls, path: str | Path) -> "PlanetCatalogue":
         """
         Load planet data from a JSON file and return a PlanetCatalogue instance.
 
+        The file may be gzip, bz2 or xz/lzma compressed (detected from its first bytes) and
+        is decompressed and parsed as a stream, one planet entry at a time. Files with a
+        ".jsonl" suffix (e.g. "planets.jsonl.xz") are read as JSON Lines, one object per line.
+
         Validates:
         - file exists
         - JSON is valid
@@ -44,40 +75,170 @@ class PlanetCatalogue:
         if not path.exists():
             raise DataValidationError(f"File not found: {path}")
 
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise DataValidationError(f"Invalid JSON in {path}: {exc}") from exc
+        with path.open("rb") as handle:
+            return cls(_parse_planet_stream(handle, str(path)))
 
-        if not isinstance(raw, list):
-            raise DataValidationError("Planet data must be a list of planet objects")
+    @classmethod
+    def from_directory(
+        cls,
+        path: str | Path,
+        pattern: str = "*.json",
+        max_workers: Optional[int] = None,
+    ) -> "PlanetCatalogue":
+        """
+        Load every JSON file matching 'pattern' in a directory and merge them into one catalogue.
 
-        planets: List[Planet] = []
+        Each file is read the same way as from_json, so compressed and ".jsonl" shards work
+        too (use a pattern such as "*.json*" to pick them up).
 
-        for idx, item in enumerate(raw):
-            # enumerate gives the list index (idx) so validation errors can point to the exact bad entry.
-            if not isinstance(item, dict):
-                raise DataValidationError(f"Planet entry at index {idx} must be a JSON object.")
+        Files are read concurrently on a thread pool (I/O bound) and parsed/validated on a
+        process pool (CPU bound). Each file is handed to the process pool as soon as it has
+        been read, so reading and parsing overlap. Passing max_workers=1 loads everything
+        in the current process without starting any pools.
 
-            try:
-                planet = Planet(
-                    name=item["name"],
-                    mass_kg=item["mass_kg"],
-                    distance_from_sun_km=item["distance_from_sun_km"],
-                    moons=item.get("moons", []),
-                )
-            except KeyError as exc:
-                raise DataValidationError(
-                    f"Missing required planet field {exc} in entry at index {idx}."
-                ) from exc
-            except DataValidationError as exc:
-                raise DataValidationError(
-                    f"Invalid data for planet {item.get('name', 'unknown')!r}: {exc}"
-                ) from exc
+        Raises DataValidationError if the directory is missing, no files match, any entry is
+        invalid (the message names the file and entry index), or the same normalised name
+        appears more than once across all files.
+        """
+        directory = Path(path)
+        if not directory.is_dir():
+            raise DataValidationError(f"Directory not found: {directory}")
+
+        files = sorted(directory.glob(pattern))
+        if not files:
+            raise DataValidationError(f"No files matching {pattern!r} in {directory}")
+
+        sources = [str(file) for file in files]
+
+        if max_workers == 1:
+            shards = [_parse_planet_file(file.read_bytes(), source) for file, source in zip(files, sources)]
+        else:
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers) as io_pool, ProcessPoolExecutor(
+                max_workers=max_workers
+            ) as cpu_pool:
+                # io_pool.map yields file contents in order as they finish reading; each one is
+                # submitted for parsing straight away instead of waiting for every read.
+                parse_futures = [
+                    cpu_pool.submit(_parse_planet_file, data, source)
+                    for data, source in zip(io_pool.map(_read_bytes, files), sources)
+                ]
+                shards = [future.result() for future in parse_futures]
+
+        return cls._from_index(_merge_shards(shards, sources))
+
+    @classmethod
+    def from_fixed_width(cls, path: str | Path, spec: "FixedWidthSpec") -> "PlanetCatalogue":
+        """
+        Load planets from a fixed-width text export (e.g. a minor-body catalogue).
+
+        'spec' is a FixedWidthSpec describing the columns.
+        The file is memory-mapped and parsed in place. Raises DataValidationError if a line
+        is invalid or a normalised name appears twice.
+        """
+        from src.services.tabular_loader import read_fixed_width
+
+        return cls._from_index(_merge_shards([read_fixed_width(path, spec)], [str(path)]))
+
+    @classmethod
+    def from_csv(cls, path: str | Path, spec: "CsvSpec") -> "PlanetCatalogue":
+        """
+        Load planets from a CSV text export.
+
+        'spec' is a CsvSpec naming the columns.
+        The file is memory-mapped and parsed in place. Raises DataValidationError if a line
+        is invalid or a normalised name appears twice.
+        """
+        from src.services.tabular_loader import read_csv
+
+        return cls._from_index(_merge_shards([read_csv(path, spec)], [str(path)]))
+
+    def add(self, planet: Planet) -> None:
+        """
+        Add a new planet to the catalogue.
+
+        Aggregate statistics are updated incrementally rather than recomputed.
+        Raises DataValidationError if a planet with the same normalised name already exists.
+        """
+        key = normalise_name(planet.name)
+        index = self._mutable_index()
+        if key in index:
+            raise DataValidationError(f"Planet already exists: {planet.name}")
+
+        index[key] = planet
+        if self._aggregates is not None:
+            self._aggregates.add(planet)
+        if self._max_name_words is not None:
+            self._max_name_words = max(self._max_name_words, _word_count(key))
+        self._completion = None
+
+    def remove(self, name: str) -> Planet:
+        """
+        Remove a planet by name and return it.
+
+        Raises PlanetNotFoundError if no matching planet is found.
+        """
+        key = normalise_name(name)
+        index = self._mutable_index()
+        if key not in index:
+            raise PlanetNotFoundError(f"Planet not found: {name}")
+
+        planet = index.pop(key)
+        if self._aggregates is not None:
+            self._aggregates.remove(planet)
+        self._completion = None
+        return planet
+
+    def replace(self, planet: Planet) -> Planet:
+        """
+        Replace the stored planet that has the same normalised name, and return the old one.
+
+        Raises PlanetNotFoundError if there is no planet with that name to replace.
+        """
+        key = normalise_name(planet.name)
+        index = self._mutable_index()
+        if key not in index:
+            raise PlanetNotFoundError(f"Planet not found: {planet.name}")
+
+        old = index[key]
+        index[key] = planet
+        if self._aggregates is not None:
+            self._aggregates.replace(old, planet)
+        if self._max_name_words is not None:
+            self._max_name_words = max(self._max_name_words, _word_count(key))
+        self._completion = None
+        return old
+
+    def aggregates(self) -> CatalogueAggregates:
+        """
+        Return catalogue-wide statistics (counts, sums, min/max, means, histograms).
 
-            planets.append(planet)
+        They are computed on first use (so loading stays as cheap as possible) and then
+        kept up to date by add/remove/replace.
+        """
+        if self._aggregates is None:
+            self._aggregates = CatalogueAggregates.from_planets(self._by_name.values())
+        return self._aggregates
+
+    def _mutable_index(self) -> Dict[str, Planet]:
+        """
+        Return the index for modification; versioned snapshots (PersistentMap) are read-only.
+        """
+        if not isinstance(self._by_name, dict):
+            raise PlanetError("This catalogue version is read-only")
+        return self._by_name
 
-        return cls(planets)
+    def max_name_words(self) -> int:
+        """
+        Return the largest number of words in any planet name (e.g. 2 for "Planet Nine").
+
+        QueryEngine uses this to bound how many words it tries as one name. After a removal
+        the value may be larger than needed, which is still a valid bound.
+        """
+        if self._max_name_words is None:
+            self._max_name_words = max((_word_count(key) for key in self._by_name), default=0)
+        return self._max_name_words
 
     def exists(self, name: str) -> bool:
         """
@@ -109,6 +270,17 @@ class PlanetCatalogue:
         """
         return sorted(p.name for p in self._by_name.values())
 
+    def complete(self, prefix: str, limit: int = 5) -> List[str]:
+        """
+        Return up to 'limit' planet names starting with 'prefix', most massive first.
+
+        The prefix is normalised so completion is case/spacing insensitive. The
+        CompletionIndex is built the first time this is called and then reused.
+        """
+        if self._completion is None:
+            self._completion = CompletionIndex.from_planets(self._by_name.values())
+        return self._completion.complete(prefix, limit)
+
     def suggest(self, name: str, limit: int = 3) -> List[str]:
         """
         Suggest close planet-name matches for a user-provided name.
@@ -116,6 +288,8 @@ class PlanetCatalogue:
         Uses difflib.get_close_matches to find similar normalised keys.
         Returns up to 'limit' suggestions as original planet names.
         """
+        import difflib  # only needed once a name is not recognised
+
         key = normalise_name(name)
 
         keys = list(self._by_name.keys())
@@ -127,3 +301,120 @@ class PlanetCatalogue:
             suggestions.append(self._by_name[match].name)
 
         return suggestions
+
+
+def _word_count(key: str) -> int:
+    """
+    Number of words in a normalised name (words are separated by single spaces).
+    """
+    return key.count(" ") + 1
+
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a whole file as bytes (used by the thread pool in from_directory).
+    """
+    return path.read_bytes()
+
+
+def _parse_planet_file(data: bytes, source: str) -> List[Planet]:
+    """
+    Parse the raw bytes of one (possibly compressed) planet file into validated Planet objects.
+
+    This is a module-level function so it can be sent to a ProcessPoolExecutor, which
+    means decompression also happens in the worker processes.
+    """
+    return _parse_planet_stream(io.BytesIO(data), source)
+
+
+def _parse_planet_stream(stream: BinaryIO, source: str) -> List[Planet]:
+    """
+    Parse a binary stream of planet JSON into validated Planet objects.
+
+    Validates:
+    - JSON is valid
+    - top-level JSON is a list (or one object per line for ".jsonl" sources)
+    - each entry is an object (dict)
+    - required fields are present and valid for constructing Planet objects
+
+    'source' is used to pick the JSON Lines format and in error messages so they
+    point to the exact file. Raises DataValidationError if the data is invalid.
+    """
+    decompressed = open_decompressed(stream)
+
+    if ".jsonl" in Path(source).suffixes:
+        records = iter_json_lines(decompressed, source)
+    else:
+        records = iter_json_array(decompressed, source)
+
+    planets: List[Planet] = []
+
+    try:
+        for idx, item in enumerate(records):
+            # enumerate gives the entry index (idx) so validation errors can point to the exact bad entry.
+            planets.append(_build_planet(item, idx, source))
+    finally:
+        records.close()  # releases the text decoder now, even if an entry was invalid
+        if decompressed is not stream:
+            decompressed.close()  # the gzip/bz2/lzma reader; this does not close 'stream'
+
+    return planets
+
+
+def _build_planet(item: Any, idx: int, source: str) -> Planet:
+    """
+    Build one Planet from a decoded JSON entry, wrapping any problem in a DataValidationError
+    that names the source file and entry index.
+    """
+    if not isinstance(item, dict):
+        raise DataValidationError(f"Planet entry at index {idx} in {source} must be a JSON object.")
+
+    try:
+        return Planet(
+            name=item["name"],
+            mass_kg=item["mass_kg"],
+            distance_from_sun_km=item["distance_from_sun_km"],
+            moons=item.get("moons", []),
+        )
+    except KeyError as exc:
+        raise DataValidationError(
+            f"Missing required planet field {exc} in entry at index {idx} in {source}."
+        ) from exc
+    except DataValidationError as exc:
+        raise DataValidationError(
+            f"Invalid data for planet {item.get('name', 'unknown')!r} in entry at index {idx} in {source}: {exc}"
+        ) from exc
+
+
+def _merge_shards(shards: List[List[Planet]], sources: List[str]) -> Dict[str, Planet]:
+    """
+    Build the normalised-name index for per-file planet lists, rejecting duplicate names.
+
+    The index is returned ready for PlanetCatalogue._from_index so names are only normalised once.
+    The error message names both places the duplicate was seen (file and entry index).
+    """
+    index: Dict[str, Planet] = {}
+
+    for shard, source in zip(shards, sources):
+        for idx, planet in enumerate(shard):
+            key = normalise_name(planet.name)
+            if key in index:
+                first_source, first_idx = _locate(index[key], shards, sources)
+                raise DataValidationError(
+                    f"Duplicate planet {planet.name!r} in entry at index {idx} in {source}; "
+                    f"already defined in entry at index {first_idx} in {first_source}."
+                )
+            index[key] = planet
+
+    return index
+
+
+def _locate(planet: Planet, shards: List[List[Planet]], sources: List[str]) -> tuple[str, int]:
+    """
+    Return (source, entry index) of a planet object; only used to build duplicate-name errors.
+    """
+    for shard, source in zip(shards, sources):
+        for idx, candidate in enumerate(shard):
+            if candidate is planet:
+                return source, idx
+    return "unknown", -1
@@ -0,0 +1,186 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.models.answer import Answer
+from src.services.catalogue import PlanetCatalogue
+from src.services.query_parser import QueryEngine
+from src.utils.text import normalise_name
+
+
+@dataclass(frozen=True, slots=True)
+class CoalescingStats:
+    """
+    A snapshot of single-flight counters.
+
+    Fields:
+    - requests: total calls made (threaded and asyncio)
+    - executions: calls that actually ran the computation
+    - coalesced: calls that waited for another caller's in-flight result instead
+    """
+    requests: int
+    executions: int
+    coalesced: int
+
+
+class _InFlightCall:
+    """
+    Holds the outcome of one threaded computation so waiting callers can read it.
+    """
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time; concurrent callers with the same key
+    share the result of the call that is already in flight.
+
+    Nothing is cached: once a computation finishes, the next call with that key runs it again.
+    Works for threads (do) and for asyncio tasks (do_async); the two paths keep separate
+    in-flight tables but share the counters.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self._async_calls: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._requests = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Return fn(), unless a call with the same key is already running in another thread,
+        in which case wait for that call and return (or raise) its outcome.
+        """
+        with self._lock:
+            self._requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Asyncio version of do(): the first caller starts fn in the loop's default executor
+        (so the event loop is not blocked) and other tasks awaiting the same key share its result.
+
+        No caller owns the shared computation: every caller, the first one included, awaits it
+        through asyncio.shield, so cancelling any one of them (even the first) only cancels
+        that caller's wait. The key is released when the computation itself finishes.
+        In-flight calls are tracked per event loop, since a future belongs to one loop.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        with self._lock:
+            self._requests += 1
+            future = self._async_calls.get(flight_key)
+            if future is None:
+                future = asyncio.ensure_future(loop.run_in_executor(None, fn))
+                future.add_done_callback(lambda done: self._finish_async(flight_key, done))
+                self._async_calls[flight_key] = future
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        return await asyncio.shield(future)
+
+    def _finish_async(self, flight_key: Tuple[int, Hashable], future: asyncio.Future) -> None:
+        """
+        Done-callback for a shared asyncio computation: release its key so the next call runs again.
+        """
+        with self._lock:
+            del self._async_calls[flight_key]
+        if not future.cancelled():
+            future.exception()  # mark as retrieved, so a failure nobody waited for is not logged
+
+    def stats(self) -> CoalescingStats:
+        """
+        Return the current request/execution/coalesced counters.
+        """
+        with self._lock:
+            return CoalescingStats(self._requests, self._executions, self._coalesced)
+
+
+class CoalescingQueryEngine:
+    """
+    Wraps a QueryEngine so identical questions asked at the same time are only answered once.
+
+    Questions are considered identical when their normalised text matches and they are
+    asked against the same catalogue object. Coalesced callers all receive the same Answer
+    instance. Answer itself is frozen, but its 'values' dict and 'suggestions' list are
+    shared between those callers, so treat them as read-only (copy them before modifying).
+    """
+
+    def __init__(self, engine: Optional[QueryEngine] = None) -> None:
+        self._engine = engine if engine is not None else QueryEngine()
+        self._flight = SingleFlight()
+
+    def ask(self, question: str, catalogue: PlanetCatalogue) -> Answer:
+        """
+        Thread-safe QueryEngine.ask with request coalescing.
+        """
+        return self._flight.do(self._key(question, catalogue), lambda: self._engine.ask(question, catalogue))
+
+    def answer(self, question: str, catalogue: PlanetCatalogue) -> str:
+        """
+        Thread-safe QueryEngine.answer with request coalescing.
+        """
+        return self.ask(question, catalogue).render()
+
+    async def ask_async(self, question: str, catalogue: PlanetCatalogue) -> Answer:
+        """
+        Asyncio QueryEngine.ask with request coalescing.
+        """
+        return await self._flight.do_async(
+            self._key(question, catalogue), lambda: self._engine.ask(question, catalogue)
+        )
+
+    async def answer_async(self, question: str, catalogue: PlanetCatalogue) -> str:
+        """
+        Asyncio QueryEngine.answer with request coalescing.
+        """
+        return (await self.ask_async(question, catalogue)).render()
+
+    def stats(self) -> CoalescingStats:
+        """
+        Return how many questions were asked, answered, and coalesced so far.
+        """
+        return self._flight.stats()
+
+    def _key(self, question: str, catalogue: PlanetCatalogue) -> Tuple[int, str]:
+        """
+        Build the coalescing key: the catalogue's identity plus the normalised question.
+        """
+        return (id(catalogue), normalise_name(question))
@@ -0,0 +1,130 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import heapq
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from src.models.planet import Planet
+from src.utils.text import normalise_name
+
+_MAX_CHAR = "\U0010ffff"  # sorts after every other character, so prefix + _MAX_CHAR bounds a prefix range
+
+
+class CompletionIndex:
+    """
+    Ranks name completions for a typed prefix (e.g. "sa" -> ["Saturn"]).
+
+    Names are kept as a sorted array of normalised keys, so all names starting with a
+    prefix form one contiguous range found with two binary searches. A segment tree over
+    the weights answers "which entry in this range has the highest weight?" in
+    O(log n), so the top 'limit' results come out in O(limit * log n) however many names
+    share the prefix. That keeps completion well under a millisecond at 10^6 names.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, float]]) -> None:
+        """
+        Build the index from (display name, weight) pairs; higher weights rank first.
+
+        Names that normalise to the same key are merged, keeping the highest weight.
+        """
+        best: Dict[str, Tuple[str, float]] = {}
+        for name, weight in entries:
+            key = normalise_name(name)
+            if key not in best or weight > best[key][1]:
+                best[key] = (name, weight)
+
+        self._keys: List[str] = sorted(best)
+        self._names: List[str] = [best[key][0] for key in self._keys]
+        self._weights: List[float] = [best[key][1] for key in self._keys]
+        self._tree: List[int] = self._build_tree()
+
+    @classmethod
+    def from_planets(
+        cls,
+        planets: Iterable[Planet],
+        weight: Callable[[Planet], float] = lambda planet: planet.mass_kg,
+        include_moons: bool = False,
+    ) -> "CompletionIndex":
+        """
+        Build an index of planet names ranked by 'weight' (mass by default).
+
+        With include_moons=True, moon names are indexed too and share their planet's weight.
+        """
+        entries: List[Tuple[str, float]] = []
+        for planet in planets:
+            planet_weight = weight(planet)
+            entries.append((planet.name, planet_weight))
+            if include_moons:
+                entries.extend((moon, planet_weight) for moon in planet.moons)
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def complete(self, prefix: str, limit: int = 5) -> List[str]:
+        """
+        Return up to 'limit' names starting with 'prefix' (case/spacing insensitive),
+        highest weight first; ties keep alphabetical order.
+        """
+        key = normalise_name(prefix)
+        lo = bisect_left(self._keys, key)
+        hi = bisect_left(self._keys, key + _MAX_CHAR, lo)
+        if lo >= hi or limit <= 0:
+            return []
+
+        # Best-first search: pop the best entry of a range, then split the range around it.
+        best = self._range_best(lo, hi)
+        heap = [(-self._weights[best], best, lo, hi)]
+        results: List[str] = []
+
+        while heap and len(results) < limit:
+            _, idx, range_lo, range_hi = heapq.heappop(heap)
+            results.append(self._names[idx])
+
+            if range_lo < idx:
+                left = self._range_best(range_lo, idx)
+                heapq.heappush(heap, (-self._weights[left], left, range_lo, idx))
+            if idx + 1 < range_hi:
+                right = self._range_best(idx + 1, range_hi)
+                heapq.heappush(heap, (-self._weights[right], right, idx + 1, range_hi))
+
+        return results
+
+    def _better(self, first: int, second: int) -> int:
+        """
+        Return whichever index has the higher weight (the lower index on a tie).
+        """
+        if self._weights[second] > self._weights[first] or (
+            self._weights[second] == self._weights[first] and second < first
+        ):
+            return second
+        return first
+
+    def _build_tree(self) -> List[int]:
+        """
+        Build a bottom-up segment tree: leaf i is at n + i and each parent holds the best child index.
+        """
+        n = len(self._keys)
+        tree = [0] * n + list(range(n))
+        for node in range(n - 1, 0, -1):
+            tree[node] = self._better(tree[2 * node], tree[2 * node + 1])
+        return tree
+
+    def _range_best(self, lo: int, hi: int) -> int:
+        """
+        Return the index of the highest-weight entry in [lo, hi) (the range must not be empty).
+        """
+        n = len(self._keys)
+        best = lo
+        lo += n
+        hi += n
+        while lo < hi:
+            if lo & 1:
+                best = self._better(best, self._tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = self._better(best, self._tree[hi])
+            lo //= 2
+            hi //= 2
+        return best
@@ -0,0 +1,362 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import argparse
+import json
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.services.catalogue import PlanetCatalogue
+from src.services.query_parser import QueryEngine
+from src.utils.errors import PlanetError
+
+REPORT_FORMAT = 1
+_FRAMES = 25  # deep enough to find the project frame behind json / dataclass internals
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+DEFAULT_QUESTIONS = [
+    "Tell me everything about Saturn",
+    "How massive is Neptune",
+    "How far is Mars from the Sun",
+    "How many moons does Jupiter have",
+    "List the moons of Mars",
+    "Is Pluto in the list of planets",
+    "What is the mass of Satrun",
+    "How many moons are there in total",
+]
+
+
+@contextmanager
+def _tracing() -> Iterator[None]:
+    """
+    Trace allocations for the duration of the block.
+
+    Tracing is only stopped afterwards if this block started it, so it can be nested
+    inside a caller's own tracemalloc session.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(_FRAMES)
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def profile_catalogue_load(path: str | Path, top: int = 10) -> Tuple[PlanetCatalogue, Dict[str, Any]]:
+    """
+    Load a catalogue with allocation tracing on and report where its memory went.
+
+    Returns (catalogue, report), where the report holds:
+    - retained_bytes / peak_bytes: memory held after loading, and the high-water mark while loading
+    - components: bytes per part of the catalogue (see measure_components), plus "other" for
+      the rest of the traced total (it can be slightly negative if loading freed memory that
+      was allocated before tracing started, e.g. internal caches)
+    - top_sites: the project source lines that allocated the most retained memory
+    """
+    with _tracing():
+        before = _start_measuring()
+        catalogue = PlanetCatalogue.from_json(path)
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = _project_snapshot()
+
+    retained = current - before
+    components = measure_components(catalogue)
+    components["other"] = retained - sum(components.values())
+
+    report = {
+        "source": Path(path).name,
+        "planets": len(catalogue.all_names()),
+        "retained_bytes": retained,
+        "peak_bytes": peak - before,
+        "components": components,
+        "top_sites": _top_sites(snapshot, top),
+    }
+    return catalogue, report
+
+
+def measure_components(catalogue: PlanetCatalogue) -> Dict[str, int]:
+    """
+    Return the bytes held by each part of a catalogue.
+
+    Components: planet_objects, planet_names, moon_lists, moon_names, numbers (masses and
+    distances), index_dict (the normalised-name index) and index_keys (its key strings).
+    Objects shared between components (e.g. a key that is also a planet name) are counted once.
+    """
+    seen: set = set()
+    sizes = {
+        "planet_objects": 0, "planet_names": 0, "moon_lists": 0, "moon_names": 0,
+        "numbers": 0, "index_dict": 0, "index_keys": 0,
+    }
+
+    def count(component: str, obj: Any) -> None:
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            sizes[component] += sys.getsizeof(obj)
+
+    index = catalogue._by_name  # diagnostics look inside the catalogue on purpose
+    count("index_dict", index)
+    for key, planet in index.items():
+        count("index_keys", key)
+        count("planet_objects", planet)
+        count("planet_names", planet.name)
+        count("numbers", planet.mass_kg)
+        count("numbers", planet.distance_from_sun_km)
+        count("moon_lists", planet.moons)
+        for moon in planet.moons:
+            count("moon_names", moon)
+
+    return sizes
+
+
+def profile_questions(
+    catalogue: PlanetCatalogue,
+    questions: Iterable[str],
+    engine: Optional[QueryEngine] = None,
+    warmup: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Measure the allocations QueryEngine.answer makes for each question.
+
+    For every question reports peak_bytes (transient memory at the busiest point of the
+    call) and retained_bytes (memory still held after the answer is discarded, e.g. caches).
+    With warmup=True every question is answered once before tracing starts (unless the
+    caller is already tracing), so one-off costs such as lazy imports or building the
+    catalogue's aggregates are not counted.
+    """
+    engine = engine or QueryEngine()
+    questions = list(questions)
+    results: List[Dict[str, Any]] = []
+
+    if warmup:
+        for question in questions:
+            engine.answer(question, catalogue)
+
+    with _tracing():
+        for question in questions:
+            before = _start_measuring()
+            engine.answer(question, catalogue)
+            current, peak = tracemalloc.get_traced_memory()
+            results.append({
+                "question": question,
+                "peak_bytes": peak - before,
+                "retained_bytes": current - before,
+            })
+
+    return results
+
+
+def build_report(path: str | Path, questions: Iterable[str] = DEFAULT_QUESTIONS, top: int = 10) -> Dict[str, Any]:
+    """
+    Profile loading the catalogue at 'path' and answering 'questions'; return a JSON-ready report.
+    """
+    catalogue, load_report = profile_catalogue_load(path, top)
+    return {
+        "format": REPORT_FORMAT,
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "catalogue": load_report,
+        "questions": profile_questions(catalogue, questions),
+    }
+
+
+def report_to_json(report: Dict[str, Any]) -> str:
+    """
+    Serialise a report with sorted keys and one value per line, so two reports diff cleanly.
+    """
+    return json.dumps(report, indent=2, sort_keys=True) + "\n"
+
+
+def diff_reports(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare two reports metric by metric.
+
+    Returns one row per metric found in both reports, as
+    {"metric", "old", "new", "change", "percent"}, where metric names look like
+    "catalogue.components.moon_names" or "questions[How massive is Neptune].peak_bytes".
+    percent is None when the old value was 0.
+    """
+    old_metrics = _flatten(old)
+    new_metrics = _flatten(new)
+
+    rows: List[Dict[str, Any]] = []
+    for metric, old_value in old_metrics.items():
+        if metric not in new_metrics:
+            continue
+        new_value = new_metrics[metric]
+        change = new_value - old_value
+        rows.append({
+            "metric": metric,
+            "old": old_value,
+            "new": new_value,
+            "change": change,
+            "percent": (change / old_value * 100) if old_value else None,
+        })
+    return rows
+
+
+def find_regressions(rows: List[Dict[str, Any]], threshold_percent: float = 10.0, min_bytes: int = 1024) -> List[Dict[str, Any]]:
+    """
+    Return the diff rows that grew by more than 'threshold_percent' and at least 'min_bytes'
+    (small absolute changes are ignored as noise).
+    """
+    return [
+        row for row in rows
+        if row["change"] >= min_bytes and (row["percent"] is None or row["percent"] > threshold_percent)
+    ]
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Return a short human-readable summary of a report (used by the CLI menu).
+    """
+    load = report["catalogue"]
+    lines = [
+        f"Catalogue {load['source']} ({load['planets']} planets): "
+        f"{load['retained_bytes']:,} bytes retained, {load['peak_bytes']:,} bytes peak while loading",
+    ]
+    for component, size in sorted(load["components"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {component:<16}{size:>12,} bytes")
+
+    lines.append("Top allocation sites:")
+    for site in load["top_sites"]:
+        lines.append(f"  {site['site']:<40}{site['bytes']:>12,} bytes in {site['blocks']} block(s)")
+
+    lines.append("Per question (peak / retained bytes):")
+    for result in report["questions"]:
+        lines.append(f"  {result['peak_bytes']:>9,} / {result['retained_bytes']:>7,}  {result['question']}")
+    return "\n".join(lines)
+
+
+def format_diff(rows: List[Dict[str, Any]]) -> str:
+    """
+    Return the changed metrics of a diff, one per line.
+    """
+    lines = []
+    for row in rows:
+        if row["change"] == 0:
+            continue
+        percent = "new" if row["percent"] is None else f"{row['percent']:+.1f}%"
+        lines.append(f"{row['metric']}: {row['old']:,} -> {row['new']:,} ({row['change']:+,} bytes, {percent})")
+    return "\n".join(lines) if lines else "No changes."
+
+
+def _start_measuring() -> int:
+    """
+    Reset the peak counter and return the currently traced size, as a baseline.
+    """
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _project_snapshot() -> tracemalloc.Snapshot:
+    """
+    Take a snapshot without the allocations made by tracemalloc and this module themselves.
+    """
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+
+
+def _top_sites(snapshot: tracemalloc.Snapshot, top: int) -> List[Dict[str, Any]]:
+    """
+    Group traced memory by the innermost project source line that allocated it.
+
+    Allocations made inside the standard library (e.g. the JSON decoder) are charged to the
+    project line that called into it, which is the line a developer can change.
+    """
+    sites: Dict[str, List[int]] = {}
+    for trace in snapshot.traces:
+        site = _project_site(trace.traceback)
+        totals = sites.setdefault(site, [0, 0])
+        totals[0] += trace.size
+        totals[1] += 1
+
+    ordered = sorted(sites.items(), key=lambda item: (-item[1][0], item[0]))
+    return [{"site": site, "bytes": size, "blocks": blocks} for site, (size, blocks) in ordered[:top]]
+
+
+def _project_site(traceback: tracemalloc.Traceback) -> str:
+    """
+    Return "path:line" of the innermost frame inside the project, or "<other>" if there is none.
+    """
+    for frame in reversed(traceback):  # tracebacks are stored oldest frame first
+        path = Path(frame.filename)
+        if path.is_absolute() and _PROJECT_ROOT in path.parents and path != Path(__file__):
+            return f"{path.relative_to(_PROJECT_ROOT).as_posix()}:{frame.lineno}"
+    return "<other>"
+
+
+def _flatten(report: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Flatten the numeric metrics of a report into {"dotted.name": value}.
+    """
+    metrics: Dict[str, int] = {}
+    load = report.get("catalogue", {})
+    for key in ("retained_bytes", "peak_bytes"):
+        if key in load:
+            metrics[f"catalogue.{key}"] = load[key]
+    for component, size in load.get("components", {}).items():
+        metrics[f"catalogue.components.{component}"] = size
+    for result in report.get("questions", []):
+        for key in ("peak_bytes", "retained_bytes"):
+            metrics[f"questions[{result['question']}].{key}"] = result[key]
+    return metrics
+
+
+def main() -> None:
+    """
+    Write a memory report from the command line, and optionally compare it with an earlier one.
+    """
+    parser = argparse.ArgumentParser(description="Report memory used by the catalogue and per question (tracemalloc).")
+    parser.add_argument("--data", default="data/planets.json", help="catalogue JSON file (may be compressed)")
+    parser.add_argument("--question", action="append", help="question to profile (repeatable; default: a built-in set)")
+    parser.add_argument("--questions-file", help="file with one question per line")
+    parser.add_argument("--output", help="write the JSON report here instead of printing it")
+    parser.add_argument("--compare", help="earlier JSON report; exit with status 1 if memory grew past --threshold")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed growth in percent (default 10)")
+    args = parser.parse_args()
+
+    questions = list(args.question or [])
+    if args.questions_file:
+        try:
+            text = Path(args.questions_file).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as exc:
+            print(f"Error reading questions: {exc}")
+            sys.exit(2)
+        questions += [line.strip() for line in text.splitlines() if line.strip()]
+
+    earlier = None
+    if args.compare:  # read before profiling, so a bad path fails straight away
+        try:
+            earlier = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            print(f"Error reading report to compare: {exc}")
+            sys.exit(2)
+
+    try:
+        report = build_report(args.data, questions or DEFAULT_QUESTIONS)
+    except PlanetError as exc:
+        print(f"Error loading data: {exc}")
+        sys.exit(2)
+
+    if args.output:
+        Path(args.output).write_text(report_to_json(report), encoding="utf-8")
+    else:
+        print(report_to_json(report), end="")
+
+    if earlier is not None:
+        rows = diff_reports(earlier, report)
+        print(format_diff(rows), file=sys.stderr)
+        regressions = find_regressions(rows, args.threshold)
+        for row in regressions:
+            print(f"REGRESSION: {row['metric']} grew by {row['change']:,} bytes", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 # External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
 
+from typing import List
+
+from src.models.answer import Answer, AnswerStatus, Intent
 from src.models.planet import Planet
+from src.services.aggregates import DISTANCE, MASS, MOONS
 
 
 def format_planet_details(planet: Planet) -> str:
@@ -75,3 +79,189 @@ def format_membership_result(name: str, is_in_list: bool) -> str:
         return f"Yes, {cleaned} is in the planet list."
 
     return f"No, {cleaned} is not in the planet list."
+
+
+def format_did_you_mean(suggestions: List[str]) -> str:
+    """
+    Return a 'Did you mean: ...?' hint for a list of suggested planet names.
+    """
+    return "Did you mean: " + ", ".join(suggestions) + "?"
+
+
+def format_unknown_planet_message(known_names: List[str]) -> str:
+    """
+    Build a helpful message when no planet name could be identified or matched.
+
+    Includes the list of valid planet names to guide the user.
+    """
+    return "Planet not found. Try one of: " + ", ".join(known_names)
+
+
+def format_unknown_question_message() -> str:
+    """
+    Return a fallback message when the question intent cannot be understood.
+
+    Provides example questions to show the user what the system can answer.
+    """
+    return (
+        "I did not understand that question.\n"
+        "Try examples like:\n"
+        "- Tell me everything about Saturn\n"
+        "- How massive is Neptune\n"
+        "- How many moons does Earth have\n"
+        "- Is Pluto in the list of planets"
+    )
+
+
+def format_planet_count(answer: Answer) -> str:
+    """
+    Return how many planets are in the list.
+    """
+    return f"There are {answer.values['planet_count']} planet(s) in the list."
+
+
+def format_total_moons(answer: Answer) -> str:
+    """
+    Return the total number of moons across all planets.
+    """
+    return f"There are {answer.values['total_moons']} moon(s) in total across {answer.values['planet_count']} planet(s)."
+
+
+def format_no_moons(answer: Answer) -> str:
+    """
+    Return how many planets have no moons.
+    """
+    return f"{answer.values['planet_count']} planet(s) have no moons."
+
+
+def format_average_mass(answer: Answer) -> str:
+    """
+    Return the average planet mass (scientific notation, like format_planet_mass).
+    """
+    mean = answer.values["mean_mass_kg"]
+    if mean is None:
+        return "There are no planets in the list."
+    return f"Average planet mass (kg): {mean:.3e}"
+
+
+def format_average_distance(answer: Answer) -> str:
+    """
+    Return the average distance from the Sun (with thousands separators, like format_planet_distance).
+    """
+    mean = answer.values["mean_distance_from_sun_km"]
+    if mean is None:
+        return "There are no planets in the list."
+    return f"Average distance from Sun (km): {mean:,.0f}"
+
+
+def format_total_mass(answer: Answer) -> str:
+    """
+    Return the combined mass of all planets (scientific notation, like format_planet_mass).
+    """
+    return f"Total mass of {answer.values['planet_count']} planet(s) (kg): {answer.values['total_mass_kg']:.3e}"
+
+
+def format_total_distance(answer: Answer) -> str:
+    """
+    Return the sum of all planets' distances from the Sun (with thousands separators).
+    """
+    total = answer.values["total_distance_from_sun_km"]
+    return f"Total distance from Sun of {answer.values['planet_count']} planet(s) (km): {total:,.0f}"
+
+
+def format_distribution(answer: Answer) -> str:
+    """
+    Return how many planets fall in each histogram bucket: powers of ten for mass and
+    distance (e.g. "1e24: 3" counts masses from 1e24 up to 1e25), exact counts for moons.
+    """
+    if answer.intent == Intent.MOON_DISTRIBUTION:
+        heading, buckets = "Planets by number of moons", answer.values[MOONS]
+        labels = {bucket: str(bucket) for bucket in buckets}
+    else:
+        field = MASS if answer.intent == Intent.MASS_DISTRIBUTION else DISTANCE
+        heading = "Planets by mass (kg)" if field == MASS else "Planets by distance from Sun (km)"
+        buckets = answer.values[field]
+        labels = {bucket: f"1e{bucket}" for bucket in buckets}
+
+    if not buckets:
+        return "There are no planets in the list."
+    return heading + ": " + ", ".join(f"{labels[bucket]}: {count}" for bucket, count in buckets.items())
+
+
+def format_extreme_planet(answer: Answer) -> str:
+    """
+    Return which planet is the most/least massive or closest/farthest, with its value.
+    """
+    planet = answer.planet
+    if planet is None:
+        return "There are no planets in the list."
+    if answer.intent == Intent.MOST_MASSIVE:
+        return f"The most massive planet is {planet.name} ({planet.mass_kg:.3e} kg)."
+    if answer.intent == Intent.LEAST_MASSIVE:
+        return f"The least massive planet is {planet.name} ({planet.mass_kg:.3e} kg)."
+    if answer.intent == Intent.CLOSEST:
+        return f"The closest planet to the Sun is {planet.name} ({planet.distance_from_sun_km:,.0f} km)."
+    return f"The farthest planet from the Sun is {planet.name} ({planet.distance_from_sun_km:,.0f} km)."
+
+
+_AGGREGATE_FORMATTERS = {
+    Intent.PLANET_COUNT: format_planet_count,
+    Intent.TOTAL_MOONS: format_total_moons,
+    Intent.NO_MOONS: format_no_moons,
+    Intent.AVERAGE_MASS: format_average_mass,
+    Intent.AVERAGE_DISTANCE: format_average_distance,
+    Intent.TOTAL_MASS: format_total_mass,
+    Intent.TOTAL_DISTANCE: format_total_distance,
+    Intent.MASS_DISTRIBUTION: format_distribution,
+    Intent.DISTANCE_DISTRIBUTION: format_distribution,
+    Intent.MOON_DISTRIBUTION: format_distribution,
+    Intent.MOST_MASSIVE: format_extreme_planet,
+    Intent.LEAST_MASSIVE: format_extreme_planet,
+    Intent.CLOSEST: format_extreme_planet,
+    Intent.FARTHEST: format_extreme_planet,
+}
+
+
+def format_answer(answer: Answer) -> str:
+    """
+    Render a structured Answer (from QueryEngine.ask) as the text shown to users.
+
+    Chooses the formatter from the answer's status and intent, so every text answer
+    is produced by the functions in this module.
+    """
+    if answer.status == AnswerStatus.EMPTY_QUESTION:
+        return "Please enter a question."
+
+    if answer.status == AnswerStatus.NAME_REQUIRED:
+        return "Please provide a name to check."
+
+    if answer.status == AnswerStatus.PLANET_NOT_FOUND:
+        if answer.suggestions:
+            return "Planet not found. " + format_did_you_mean(answer.suggestions)
+        return format_unknown_planet_message(answer.values.get("known_planets", []))
+
+    if answer.intent == Intent.MEMBERSHIP:
+        text = format_membership_result(answer.values["name"], answer.values["in_list"])
+        if answer.suggestions:
+            return text + " " + format_did_you_mean(answer.suggestions)
+        return text
+
+    if answer.status == AnswerStatus.OK and answer.intent in _AGGREGATE_FORMATTERS:
+        return _AGGREGATE_FORMATTERS[answer.intent](answer)
+
+    planet = answer.planet
+    if answer.status == AnswerStatus.UNKNOWN_QUESTION or planet is None:
+        return format_unknown_question_message()
+
+    if answer.intent == Intent.DETAILS:
+        return format_planet_details(planet)
+    if answer.intent == Intent.MASS:
+        return format_planet_mass(planet)
+    if answer.intent == Intent.DISTANCE:
+        return format_planet_distance(planet)
+    if answer.intent == Intent.MOON_COUNT:
+        return format_planet_moon_count(planet)
+    if answer.intent == Intent.MOON_LIST:
+        return format_planet_moon_list(planet)
+
+    return format_unknown_question_message()
@@ -1,59 +1,85 @@
 # External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
 
-import difflib
-from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from src.models.answer import Answer, AnswerStatus, Intent
+from src.models.planet import Planet
+from src.services.aggregates import DISTANCE, MASS, MOONS
 from src.services.catalogue import PlanetCatalogue
-from src.services.formatter import (
-    format_planet_details,
-    format_planet_distance,
-    format_planet_mass,
-    format_planet_moon_count,
-    format_planet_moon_list,
-    format_membership_result,
-)
 from src.utils.text import normalise_name
 
-
-class Intent(str, Enum):
-    """
-    Represents the supported question types (intents) the QueryEngine can recognise.
-
-    Each value is a simple label used to route the question to the correct answer logic.
-    """
-    DETAILS = "details"
-    MASS = "mass"
-    DISTANCE = "distance"
-    MOON_COUNT = "moon_count"
-    MOON_LIST = "moon_list"
-    MEMBERSHIP = "membership"
-    UNKNOWN = "unknown"
+# Words that catalogue-wide questions are made of. When checking such a question for a
+# misspelt planet name they are skipped, since some of them look like planet names to
+# difflib ("mass" -> Mars, "sun" -> Saturn, "nearest" -> Earth).
+_AGGREGATE_WORDS = frozenset({
+    "average", "mean", "total", "sum", "altogether", "combined", "distribution", "distributed", "breakdown",
+    "mass", "massive", "weigh", "weight", "distance", "far", "sun", "moon", "moons", "planet", "planets",
+    "heaviest", "lightest", "biggest", "largest", "smallest", "closest", "nearest", "farthest", "furthest",
+})
+
+_DISTRIBUTION_FIELDS = {
+    Intent.MASS_DISTRIBUTION: MASS,
+    Intent.DISTANCE_DISTRIBUTION: DISTANCE,
+    Intent.MOON_DISTRIBUTION: MOONS,
+}
+
+# Superlatives name one planet; a question may ask something else about it ("which moons does
+# the closest planet have"). Each maps to the per-planet intent its own answer already covers.
+_SUPERLATIVE_FIELD_INTENTS = {
+    Intent.MOST_MASSIVE: Intent.MASS,
+    Intent.LEAST_MASSIVE: Intent.MASS,
+    Intent.CLOSEST: Intent.DISTANCE,
+    Intent.FARTHEST: Intent.DISTANCE,
+}
 
 
 class QueryEngine:
     """
     Interprets a user's question, detects what they are asking, finds the planet (if any),
-    and returns a formatted answer string.
+    and returns either a structured Answer (ask) or a formatted answer string (answer).
     """
 
     def answer(self, question: str, catalogue: PlanetCatalogue) -> str:
         """
-        Produce an answer to a user question using the provided PlanetCatalogue.
+        Produce a formatted text answer to a user question using the provided PlanetCatalogue.
+
+        This is a thin wrapper: the question is resolved by ask() and the result is rendered
+        through the formatter module.
+        """
+        return self.ask(question, catalogue).render()
+
+    def ask(self, question: str, catalogue: PlanetCatalogue) -> Answer:
+        """
+        Resolve a user question into a structured Answer without building any text.
 
         Steps:
         - normalise and validate the input question
-        - detect the intent (mass, distance, moons, etc.)
         - extract a planet name from the question (if present)
-        - return the correctly formatted response or a helpful fallback message
+        - if no planet is named, check for a catalogue-wide question (totals, averages, extremes,
+          distributions), unless it looks like a misspelt planet name or an "is X ..." question
+        - detect the intent (mass, distance, moons, etc.)
+        - return the matching values, or a status describing why there is no answer
         """
         cleaned = normalise_name(question)
         if cleaned == "":
-            return "Please enter a question."
+            return Answer(AnswerStatus.EMPTY_QUESTION, Intent.UNKNOWN)
+
+        planet_name = self._extract_planet_name(cleaned, catalogue)
 
         intent = self._detect_intent(cleaned)
 
-        planet_name = self._extract_planet_name(cleaned, catalogue)
+        # A named planet always wins: "How many moons does Jupiter have in total" is about Jupiter.
+        # So does a misspelt one ("mean distance of marss"), and "is pluto the smallest planet"
+        # asks whether Pluto is in the list.
+        if planet_name is None and not cleaned.startswith("is "):
+            aggregate_intent = self._detect_aggregate_intent(cleaned)
+            if aggregate_intent is not None and not self._suggest_from_text(cleaned, catalogue, skip=_AGGREGATE_WORDS):
+                answer = self._answer_aggregate(aggregate_intent, catalogue)
+                field_intent = _SUPERLATIVE_FIELD_INTENTS.get(aggregate_intent)
+                if field_intent is None or answer.planet is None or intent in (field_intent, Intent.MEMBERSHIP, Intent.UNKNOWN):
+                    return answer
+                # "which moons does the closest planet have": answer the question about that planet.
+                return Answer(AnswerStatus.OK, intent, planet=answer.planet, values=self._planet_values(intent, answer.planet))
 
         if intent == Intent.MEMBERSHIP:
             return self._answer_membership(cleaned, planet_name, catalogue)
@@ -61,27 +87,139 @@ class QueryEngine:
         if planet_name is None:
             suggestions = self._suggest_from_text(cleaned, catalogue)
             if suggestions:
-                return (
-                    "Planet not found. Did you mean: "
-                    + ", ".join(suggestions)
-                    + "?"
-                )
-            return self._unknown_planet_message(catalogue)
+                return Answer(AnswerStatus.PLANET_NOT_FOUND, intent, suggestions=suggestions)
+            return Answer(
+                AnswerStatus.PLANET_NOT_FOUND,
+                intent,
+                values={"known_planets": catalogue.all_names()},
+            )
 
         planet = catalogue.get(planet_name)
 
-        if intent == Intent.DETAILS:
-            return format_planet_details(planet)
+        if intent == Intent.UNKNOWN:
+            return Answer(AnswerStatus.UNKNOWN_QUESTION, intent, planet=planet)
+
+        return Answer(AnswerStatus.OK, intent, planet=planet, values=self._planet_values(intent, planet))
+
+    def _planet_values(self, intent: Intent, planet: Planet) -> Dict[str, Any]:
+        """
+        Return the raw values a planet question asks for, keyed by Planet field name.
+        """
         if intent == Intent.MASS:
-            return format_planet_mass(planet)
+            return {"mass_kg": planet.mass_kg}
         if intent == Intent.DISTANCE:
-            return format_planet_distance(planet)
+            return {"distance_from_sun_km": planet.distance_from_sun_km}
         if intent == Intent.MOON_COUNT:
-            return format_planet_moon_count(planet)
+            return {"moon_count": planet.moon_count()}
         if intent == Intent.MOON_LIST:
-            return format_planet_moon_list(planet)
+            return {"moons": list(planet.moons)}
+
+        return {
+            "name": planet.name,
+            "mass_kg": planet.mass_kg,
+            "distance_from_sun_km": planet.distance_from_sun_km,
+            "moons": list(planet.moons),
+        }
+
+    def _detect_aggregate_intent(self, cleaned: str) -> Optional[Intent]:
+        """
+        Detect questions about the whole catalogue rather than one planet.
+
+        Only called when the question names no planet.
+
+        Returns an Intent such as:
+        - NO_MOONS for "how many planets have no moons"
+        - TOTAL_MOONS for "how many moons are there in total"
+        - PLANET_COUNT for "how many planets are there"
+        - MASS_DISTRIBUTION / DISTANCE_DISTRIBUTION / MOON_DISTRIBUTION for "mass distribution"
+          or "how are the moons distributed"
+        - AVERAGE_MASS / AVERAGE_DISTANCE for "average mass" / "mean distance"
+        - TOTAL_MASS / TOTAL_DISTANCE for "total mass" / "combined distance"
+        - MOST_MASSIVE, LEAST_MASSIVE, CLOSEST, FARTHEST for superlatives
+        Returns None if the question is not catalogue-wide.
+        """
+        has_moon = "moon" in cleaned
+        counting = "how many" in cleaned or "number of" in cleaned
+
+        if "distribution" in cleaned or "distributed" in cleaned or "breakdown" in cleaned:
+            if has_moon:
+                return Intent.MOON_DISTRIBUTION
+            if "mass" in cleaned or "weigh" in cleaned:
+                return Intent.MASS_DISTRIBUTION
+            if "distance" in cleaned or "far" in cleaned:
+                return Intent.DISTANCE_DISTRIBUTION
+
+        if has_moon and counting and ("no moon" in cleaned or "without moon" in cleaned or "zero moon" in cleaned):
+            return Intent.NO_MOONS
+
+        if has_moon and ("total" in cleaned or "altogether" in cleaned or "combined" in cleaned or "all planets" in cleaned):
+            return Intent.TOTAL_MOONS
+
+        if counting and "planets" in cleaned and not has_moon:  # "how many planets have moons" is not a plain count
+            return Intent.PLANET_COUNT
 
-        return self._unknown_question_message()
+        if "average" in cleaned or "mean" in cleaned:
+            if "mass" in cleaned or "weigh" in cleaned:
+                return Intent.AVERAGE_MASS
+            if "distance" in cleaned or "far" in cleaned:
+                return Intent.AVERAGE_DISTANCE
+
+        if "total" in cleaned or "sum" in cleaned or "altogether" in cleaned or "combined" in cleaned:
+            if "mass" in cleaned or "weigh" in cleaned:
+                return Intent.TOTAL_MASS
+            if "distance" in cleaned:
+                return Intent.TOTAL_DISTANCE
+
+        if "most massive" in cleaned or "heaviest" in cleaned or "biggest" in cleaned or "largest" in cleaned:
+            return Intent.MOST_MASSIVE
+
+        if "least massive" in cleaned or "lightest" in cleaned or "smallest" in cleaned:
+            return Intent.LEAST_MASSIVE
+
+        if "closest" in cleaned or "nearest" in cleaned:
+            return Intent.CLOSEST
+
+        if "farthest" in cleaned or "furthest" in cleaned:
+            return Intent.FARTHEST
+
+        return None
+
+    def _answer_aggregate(self, intent: Intent, catalogue: PlanetCatalogue) -> Answer:
+        """
+        Answer a catalogue-wide question from the catalogue's precomputed aggregates (O(1)).
+        """
+        stats = catalogue.aggregates()
+
+        if intent == Intent.PLANET_COUNT:
+            return Answer(AnswerStatus.OK, intent, values={"planet_count": stats.count()})
+        if intent == Intent.TOTAL_MOONS:
+            return Answer(AnswerStatus.OK, intent, values={"total_moons": stats.total(MOONS), "planet_count": stats.count()})
+        if intent == Intent.NO_MOONS:
+            return Answer(AnswerStatus.OK, intent, values={"planet_count": stats.planets_without_moons()})
+        if intent == Intent.AVERAGE_MASS:
+            return Answer(AnswerStatus.OK, intent, values={"mean_mass_kg": stats.mean(MASS)})
+        if intent == Intent.AVERAGE_DISTANCE:
+            return Answer(AnswerStatus.OK, intent, values={"mean_distance_from_sun_km": stats.mean(DISTANCE)})
+        if intent == Intent.TOTAL_MASS:
+            return Answer(AnswerStatus.OK, intent, values={"total_mass_kg": stats.total(MASS), "planet_count": stats.count()})
+        if intent == Intent.TOTAL_DISTANCE:
+            return Answer(AnswerStatus.OK, intent, values={"total_distance_from_sun_km": stats.total(DISTANCE), "planet_count": stats.count()})
+        if intent in _DISTRIBUTION_FIELDS:
+            field = _DISTRIBUTION_FIELDS[intent]
+            return Answer(AnswerStatus.OK, intent, values={field: stats.histogram(field)})
+
+        if intent in (Intent.MOST_MASSIVE, Intent.LEAST_MASSIVE):
+            field = MASS
+            extreme = stats.maximum(MASS) if intent == Intent.MOST_MASSIVE else stats.minimum(MASS)
+        else:
+            field = DISTANCE
+            extreme = stats.maximum(DISTANCE) if intent == Intent.FARTHEST else stats.minimum(DISTANCE)
+
+        if extreme is None:
+            return Answer(AnswerStatus.OK, intent, values={field: None})
+
+        value, name = extreme
+        return Answer(AnswerStatus.OK, intent, planet=catalogue.get(name), values={field: value})
 
     def _detect_intent(self, cleaned: str) -> Intent:
         """
@@ -121,47 +259,56 @@ class QueryEngine:
         """
         Try to find a planet name inside the cleaned question text.
 
-        This checks for whole-word matches by padding the string with spaces, so
-        'mars' matches '... mars ...' but avoids partial matches inside other words.
+        Every run of whole words in the question (e.g. "mars", "is mars", ...) up to the
+        longest name in the catalogue (catalogue.max_name_words()) is looked up, so 'mars'
+        matches '... mars ...' but partial matches inside other words are avoided. The cost
+        grows linearly with the question length and does not depend on the catalogue size.
+        If several names match, the alphabetically first one wins.
 
         Returns the original planet name (as stored in the catalogue) if found,
         otherwise returns None.
         """
-        padded = " " + cleaned + " "
-        names = catalogue.all_names()
+        tokens = cleaned.split(" ")
+        found: Optional[str] = None
 
-        for name in names:
-            key = normalise_name(name)
-            needle = " " + key + " "
-            if needle in padded:
-                return name
+        max_words = catalogue.max_name_words()
 
-        return None
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(start + max_words, len(tokens)) + 1):
+                span = " ".join(tokens[start:end])
+                if catalogue.exists(span):
+                    name = catalogue.get(span).name
+                    if found is None or name < found:
+                        found = name
+
+        return found
 
-    def _answer_membership(self, cleaned: str, planet_name: Optional[str], catalogue: PlanetCatalogue) -> str:
+    def _answer_membership(self, cleaned: str, planet_name: Optional[str], catalogue: PlanetCatalogue) -> Answer:
         """
         Answer questions like 'Is Pluto a planet?' or 'Is Mars in the list of planets?'.
 
-        If a planet name is already extracted from the question, it returns a positive membership response.
+        If a planet name is already extracted from the question, it returns a positive membership answer.
         Otherwise it tries to guess a candidate name from the text, checks the catalogue,
-        and returns a formatted yes/no with optional suggestions for close matches.
+        and returns a yes/no answer with optional suggestions for close matches.
         """
         if planet_name is not None:
-            return format_membership_result(planet_name, True)
+            planet = catalogue.get(planet_name)
+            return Answer(AnswerStatus.OK, Intent.MEMBERSHIP, planet=planet, values={"name": planet.name, "in_list": True})
 
         candidate = self._extract_membership_candidate(cleaned)
         if candidate is None:
-            return "Please provide a name to check."
+            return Answer(AnswerStatus.NAME_REQUIRED, Intent.MEMBERSHIP)
 
         if catalogue.exists(candidate):
             planet = catalogue.get(candidate)
-            return format_membership_result(planet.name, True)
+            return Answer(AnswerStatus.OK, Intent.MEMBERSHIP, planet=planet, values={"name": planet.name, "in_list": True})
 
-        suggestions = catalogue.suggest(candidate)
-        if suggestions:
-            return format_membership_result(candidate, False) + " Did you mean: " + ", ".join(suggestions) + "?"
-
-        return format_membership_result(candidate, False)
+        return Answer(
+            AnswerStatus.OK,
+            Intent.MEMBERSHIP,
+            values={"name": candidate, "in_list": False},
+            suggestions=catalogue.suggest(candidate),
+        )
 
     def _extract_membership_candidate(self, cleaned: str) -> Optional[str]:
         """
@@ -192,45 +339,22 @@ class QueryEngine:
 
         return last_word
 
-    def _suggest_from_text(self, cleaned: str, catalogue: PlanetCatalogue) -> list[str]:
+    def _suggest_from_text(self, cleaned: str, catalogue: PlanetCatalogue, skip: frozenset = frozenset()) -> list[str]:
         """
         Suggest planet names based on a likely token inside the user's question.
 
-        Heuristic: choose the last alphabetic word as the best token, then ask the catalogue
-        for close matches (e.g., to handle typos like 'marss').
+        Heuristic: choose the last alphabetic word (ignoring any word in 'skip') as the best
+        token, then ask the catalogue for close matches (e.g., to handle typos like 'marss').
         Returns a list of suggested planet names (may be empty).
         """
         tokens = cleaned.split(" ")
         best_token = None
 
         for token in tokens:
-            if token.isalpha():
+            if token.isalpha() and token not in skip:
                 best_token = token
 
         if best_token is None:
             return []
 
         return catalogue.suggest(best_token)
-
-    def _unknown_planet_message(self, catalogue: PlanetCatalogue) -> str:
-        """
-        Build a helpful message when no planet name could be identified or matched.
-
-        Includes the list of valid planet names from the catalogue to guide the user.
-        """
-        return "Planet not found. Try one of: " + ", ".join(catalogue.all_names())
-
-    def _unknown_question_message(self) -> str:
-        """
-        Return a fallback message when the question intent cannot be understood.
-
-        Provides example questions to show the user what the system can answer.
-        """
-        return (
-            "I did not understand that question.\n"
-            "Try examples like:\n"
-            "- Tell me everything about Saturn\n"
-            "- How massive is Neptune\n"
-            "- How many moons does Earth have\n"
-            "- Is Pluto in the list of planets"
-        )
@@ -0,0 +1,398 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import heapq
+import struct
+from array import array
+from bisect import bisect_left
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models.planet import Planet
+from src.services.aggregates import DISTANCE, MASS, MOONS
+from src.services.catalogue import PlanetCatalogue
+from src.utils.errors import DataValidationError, PlanetNotFoundError
+from src.utils.text import normalise_name
+
+_MAGIC = b"PLANETS3"
+# magic, planet count, moon count, string blob size, max words per name, histogram buckets (48 bytes)
+_HEADER = struct.Struct("<8sqqqqq")
+_ITEM = 8  # every numeric column is 8 bytes wide (float64 or int64), which keeps sections aligned
+_FIELDS = (MASS, DISTANCE, MOONS)  # order of the fields in the aggregate sections
+
+
+class SharedCatalogue:
+    """
+    A read-only planet catalogue stored in one multiprocessing.shared_memory segment.
+
+    The parent process builds the segment once with create(); worker processes call
+    attach() and read the columns in place through memoryviews, so adding workers does
+    not add more copies of the data. Planet objects are only built for the planets a
+    question actually touches.
+
+    Segment layout (after a fixed header), with rows sorted by planet name:
+    - mass_kg, distance_from_sun_km: float64 columns
+    - name_offsets: int64, row i's name is blob[name_offsets[i]:name_offsets[i + 1]]
+    - moon_starts: int64, row i's moons are moon numbers moon_starts[i]..moon_starts[i + 1]
+    - moon_offsets: int64, moon j's name is blob[moon_offsets[j]:moon_offsets[j + 1]]
+    - key_offsets / key_rows: normalised names sorted as UTF-8 bytes, and the row each belongs to
+    - aggregate totals: float64 [total mass, total distance]
+    - aggregate counts: int64 [planet count, total moons, then min row and max row for mass,
+      distance and moons (-1 if empty)]
+    - aggregate histograms: int64 [bucket count per field (3 values), then (bucket, planets) pairs]
+    - blob: all strings as UTF-8
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory) -> None:
+        """
+        Wrap an existing segment. Use create() or attach() rather than calling this directly.
+        """
+        self._shm = shm
+        self._buf = shm.buf.toreadonly()
+
+        magic, planets, moons, blob_size, self._max_name_words, buckets = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            self._buf.release()
+            raise DataValidationError(f"Shared memory segment {shm.name!r} is not a planet catalogue")
+
+        self._size = planets
+        offset = _HEADER.size
+        self._mass, offset = self._column(offset, planets, "d")
+        self._distance, offset = self._column(offset, planets, "d")
+        self._name_offsets, offset = self._column(offset, planets + 1, "q")
+        self._moon_starts, offset = self._column(offset, planets + 1, "q")
+        self._moon_offsets, offset = self._column(offset, moons + 1, "q")
+        self._key_offsets, offset = self._column(offset, planets + 1, "q")
+        self._key_rows, offset = self._column(offset, planets, "q")
+        self._agg_totals, offset = self._column(offset, 2, "d")
+        self._agg_counts, offset = self._column(offset, 2 + 2 * len(_FIELDS), "q")
+        self._agg_histograms, offset = self._column(offset, len(_FIELDS) + 2 * buckets, "q")
+        self._blob = self._buf[offset:offset + blob_size]
+        self._suggest_keys: Optional[List[str]] = None  # decoded on first use by suggest()
+
+    @classmethod
+    def create(cls, catalogue: PlanetCatalogue, name: Optional[str] = None) -> "SharedCatalogue":
+        """
+        Copy a PlanetCatalogue into a new shared memory segment and return a view of it.
+
+        The caller owns the segment and must call unlink() (after close()) when finished.
+        """
+        planets = [catalogue.get(planet_name) for planet_name in catalogue.all_names()]  # all_names() is sorted
+        keys = sorted((normalise_name(planet.name).encode("utf-8"), row) for row, planet in enumerate(planets))
+
+        blob = bytearray()
+        name_offsets = _string_offsets(blob, [planet.name for planet in planets])
+        moon_names = [moon for planet in planets for moon in planet.moons]
+        moon_offsets = _string_offsets(blob, moon_names)
+        key_offsets = _bytes_offsets(blob, [key for key, _ in keys])
+
+        moon_starts = [0]
+        for planet in planets:
+            moon_starts.append(moon_starts[-1] + len(planet.moons))
+
+        # Catalogue-wide statistics are computed once here, so workers never rebuild them.
+        stats = catalogue.aggregates()
+        rows = {planet.name: row for row, planet in enumerate(planets)}
+        counts = [stats.count(), stats.total(MOONS)]
+        histograms: List[int] = []
+        pairs: List[int] = []
+        for field in _FIELDS:
+            for extreme in (stats.minimum(field), stats.maximum(field)):
+                counts.append(rows[extreme[1]] if extreme is not None else -1)
+            histogram = stats.histogram(field)
+            histograms.append(len(histogram))
+            for bucket, planet_count in histogram.items():
+                pairs += [bucket, planet_count]
+
+        columns = [
+            ("d", [planet.mass_kg for planet in planets]),
+            ("d", [planet.distance_from_sun_km for planet in planets]),
+            ("q", name_offsets),
+            ("q", moon_starts),
+            ("q", moon_offsets),
+            ("q", key_offsets),
+            ("q", [row for _, row in keys]),
+            ("d", [stats.total(MASS), stats.total(DISTANCE)]),
+            ("q", counts),
+            ("q", histograms + pairs),
+        ]
+        size = _HEADER.size + sum(len(values) * _ITEM for _, values in columns) + len(blob)
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        try:
+            _HEADER.pack_into(
+                shm.buf, 0, _MAGIC, len(planets), len(moon_names), len(blob), catalogue.max_name_words(), len(pairs) // 2,
+            )
+            offset = _HEADER.size
+            for fmt, values in columns:
+                # array uses native byte order, the same as memoryview.cast when reading back.
+                shm.buf[offset:offset + len(values) * _ITEM] = array(fmt, values).tobytes()
+                offset += len(values) * _ITEM
+            shm.buf[offset:offset + len(blob)] = blob
+            return cls(shm)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCatalogue":
+        """
+        Open an existing segment by name (read-only). Intended for worker processes forked
+        from the process that called create().
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError as exc:
+            raise DataValidationError(f"Shared catalogue not found: {name}") from exc
+        return cls(shm)
+
+    @property
+    def name(self) -> str:
+        """
+        The shared memory segment name that workers pass to attach().
+        """
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the shared memory segment in bytes.
+        """
+        return self._shm.size
+
+    def close(self) -> None:
+        """
+        Release this process's views and mapping of the segment (the segment itself remains).
+        """
+        for view in (
+            self._blob, self._mass, self._distance, self._name_offsets, self._moon_starts,
+            self._moon_offsets, self._key_offsets, self._key_rows,
+            self._agg_totals, self._agg_counts, self._agg_histograms, self._buf,
+        ):
+            view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the segment. Call once, from the process that created it.
+        """
+        self._shm.unlink()
+
+    def exists(self, name: str) -> bool:
+        """
+        Check whether a planet exists by name (case/spacing insensitive).
+        """
+        return self._find_row(name) is not None
+
+    def get(self, name: str) -> Planet:
+        """
+        Return the Planet matching the given name, built from the shared columns.
+
+        Raises PlanetNotFoundError if no matching planet is found.
+        """
+        row = self._find_row(name)
+        if row is None:
+            raise PlanetNotFoundError(f"Planet not found: {name}")
+
+        first_moon, last_moon = self._moon_starts[row], self._moon_starts[row + 1]
+        return Planet(
+            name=self._string(self._name_offsets, row),
+            mass_kg=self._mass[row],
+            distance_from_sun_km=self._distance[row],
+            moons=[self._string(self._moon_offsets, moon) for moon in range(first_moon, last_moon)],
+        )
+
+    def max_name_words(self) -> int:
+        """
+        Return the largest number of words in any planet name (stored in the header at create time).
+        """
+        return self._max_name_words
+
+    def all_names(self) -> List[str]:
+        """
+        Return a sorted list of all planet names (rows are stored in name order).
+        """
+        return [self._string(self._name_offsets, row) for row in range(self._size)]
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """
+        Suggest close planet-name matches, like PlanetCatalogue.suggest (same scoring and order).
+
+        The keys are decoded once per process, on the first call (difflib needs str), and the
+        matching keeps each candidate's position, so no call rescans the key table.
+        """
+        import difflib  # only needed once a name is not recognised
+
+        if self._suggest_keys is None:
+            self._suggest_keys = [self._string(self._key_offsets, idx) for idx in range(self._size)]
+
+        # Same filters and ranking as difflib.get_close_matches(n=limit, cutoff=0.6), but the
+        # candidate's index travels with its score so the row is known without a search.
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(normalise_name(name))
+        scored: List[Tuple[float, str, int]] = []
+        for idx, key in enumerate(self._suggest_keys):
+            matcher.set_seq1(key)
+            if matcher.real_quick_ratio() >= 0.6 and matcher.quick_ratio() >= 0.6 and matcher.ratio() >= 0.6:
+                scored.append((matcher.ratio(), key, idx))
+
+        best = heapq.nlargest(limit, scored) if limit > 0 else []
+        return [self._string(self._name_offsets, self._key_rows[idx]) for _, _, idx in best]
+
+    def aggregates(self) -> "_SharedAggregates":
+        """
+        Return catalogue-wide statistics with the same read methods as PlanetCatalogue.aggregates().
+
+        They were computed by the process that called create() and are read from the segment,
+        so workers share them instead of each building their own copy.
+        """
+        return _SharedAggregates(self._agg_totals, self._agg_counts, self._agg_histograms, self._row_value)
+
+    def _row_value(self, row: int, field: str) -> Tuple[float, str]:
+        """
+        (value of 'field', planet name) for one row, read from the columns without building a Planet.
+        """
+        if field == MASS:
+            value = self._mass[row]
+        elif field == DISTANCE:
+            value = self._distance[row]
+        else:
+            value = self._moon_starts[row + 1] - self._moon_starts[row]
+        return value, self._string(self._name_offsets, row)
+
+    def _find_row(self, name: str) -> Optional[int]:
+        """
+        Binary-search the sorted key table for a name; return its row or None.
+        """
+        needle = normalise_name(name).encode("utf-8")
+        keys = _SortedKeys(self._blob, self._key_offsets, self._size)
+        idx = bisect_left(keys, needle)
+        if idx < self._size and keys[idx] == needle:
+            return self._key_rows[idx]
+        return None
+
+    def _string(self, offsets: memoryview, idx: int) -> str:
+        """
+        Decode string number idx of a string table straight from the shared blob.
+        """
+        return str(self._blob[offsets[idx]:offsets[idx + 1]], "utf-8")
+
+    def _column(self, offset: int, count: int, fmt: str) -> Tuple[memoryview, int]:
+        """
+        Return a typed view of 'count' 8-byte values at 'offset', and the offset after it.
+        """
+        end = offset + count * _ITEM
+        return self._buf[offset:end].cast(fmt), end
+
+
+class _SharedAggregates:
+    """
+    Read-only view of the aggregate sections of a SharedCatalogue segment.
+
+    Offers the read methods of CatalogueAggregates (count, total, mean, minimum, maximum,
+    histogram, planets_without_moons); every read is O(1) apart from building a histogram dict.
+    """
+
+    def __init__(
+        self,
+        totals: memoryview,
+        counts: memoryview,
+        histograms: memoryview,
+        row_value: Callable[[int, str], Tuple[float, str]],
+    ) -> None:
+        self._totals = totals  # sum of mass, sum of distance
+        self._counts = counts  # planet count, moon total, then the min/max row of each field
+        self._histograms = histograms  # bucket count per field, then (bucket, planets) pairs
+        self._row_value = row_value  # (row, field) -> (value, planet name), from the catalogue's columns
+
+    def count(self) -> int:
+        """
+        Number of planets.
+        """
+        return self._counts[0]
+
+    def total(self, field: str) -> float:
+        """
+        Sum of a field over all planets (e.g. total(MOONS) is the total number of moons).
+        """
+        if field == MOONS:
+            return self._counts[1]
+        return self._totals[_FIELDS.index(field)]
+
+    def mean(self, field: str) -> Optional[float]:
+        """
+        Average of a field, or None if there are no planets.
+        """
+        count = self.count()
+        return self.total(field) / count if count else None
+
+    def minimum(self, field: str) -> Optional[Tuple[float, str]]:
+        """
+        (smallest value, planet name) for a field, or None if there are no planets.
+        """
+        return self._extreme(field, 0)
+
+    def maximum(self, field: str) -> Optional[Tuple[float, str]]:
+        """
+        (largest value, planet name) for a field, or None if there are no planets.
+        """
+        return self._extreme(field, 1)
+
+    def histogram(self, field: str) -> Dict[int, int]:
+        """
+        Bucket -> number of planets, sorted by bucket (same buckets as CatalogueAggregates.histogram).
+        """
+        histograms = self._histograms
+        position = _FIELDS.index(field)
+        start = len(_FIELDS) + 2 * sum(histograms[idx] for idx in range(position))
+        return {histograms[start + 2 * idx]: histograms[start + 2 * idx + 1] for idx in range(histograms[position])}
+
+    def planets_without_moons(self) -> int:
+        """
+        Number of planets with no moons.
+        """
+        return self.histogram(MOONS).get(0, 0)
+
+    def _extreme(self, field: str, which: int) -> Optional[Tuple[float, str]]:
+        """
+        (value, planet name) for the stored min (which=0) or max (which=1) row of a field.
+        """
+        row = self._counts[2 + 2 * _FIELDS.index(field) + which]
+        if row < 0:
+            return None
+        return self._row_value(row, field)
+
+
+class _SortedKeys:
+    """
+    A sequence view over the sorted key table, so bisect can search it without decoding every key.
+    """
+
+    def __init__(self, blob: memoryview, offsets: memoryview, size: int) -> None:
+        self._blob = blob
+        self._offsets = offsets
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx: int) -> bytes:
+        return bytes(self._blob[self._offsets[idx]:self._offsets[idx + 1]])
+
+
+def _string_offsets(blob: bytearray, strings: List[str]) -> List[int]:
+    """
+    Append strings to the blob as UTF-8 and return their n + 1 boundary offsets.
+    """
+    return _bytes_offsets(blob, [value.encode("utf-8") for value in strings])
+
+
+def _bytes_offsets(blob: bytearray, values: List[bytes]) -> List[int]:
+    """
+    Append byte strings to the blob and return their n + 1 boundary offsets.
+    """
+    offsets = [len(blob)]
+    for value in values:
+        blob += value
+        offsets.append(len(blob))
+    return offsets
@@ -0,0 +1,270 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import mmap
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from src.models.planet import Planet
+from src.utils.errors import DataValidationError
+
+Column = Union[int, str]  # CSV column: zero-based index, or header name when the file has a header row
+
+
+@dataclass(frozen=True, slots=True)
+class FixedWidthSpec:
+    """
+    Describes where each planet field sits in a fixed-width text file.
+
+    Each field is a (start, end) byte range within a line, like a Python slice.
+    Fields:
+    - name, mass_kg, distance_from_sun_km: required columns
+    - moons: optional column holding moon names separated by 'moon_separator'
+    - skip_lines: number of header lines to ignore at the top of the file
+    """
+    name: Tuple[int, int]
+    mass_kg: Tuple[int, int]
+    distance_from_sun_km: Tuple[int, int]
+    moons: Optional[Tuple[int, int]] = None
+    moon_separator: str = ";"
+    skip_lines: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CsvSpec:
+    """
+    Describes which CSV columns hold each planet field.
+
+    Columns are zero-based indexes, or header names if 'has_header' is True.
+    Quoted fields are not supported: values must not contain the delimiter.
+    """
+    name: Column
+    mass_kg: Column
+    distance_from_sun_km: Column
+    moons: Optional[Column] = None
+    delimiter: str = ","
+    moon_separator: str = ";"
+    has_header: bool = True
+
+
+def read_fixed_width(path: str | Path, spec: FixedWidthSpec) -> List[Planet]:
+    """
+    Read planets from a fixed-width text file described by 'spec'.
+
+    The file is memory-mapped and each field is sliced straight out of the mapped
+    buffer, so lines are never copied into separate strings.
+    Raises DataValidationError (naming the line) if a record is invalid.
+    """
+    source = str(path)
+    if spec.moon_separator == "":
+        raise DataValidationError("FixedWidthSpec.moon_separator must not be empty")
+    planets: List[Planet] = []
+
+    # Unpacked once so the per-line work is just four slices of the mapped buffer.
+    name_from, name_to = spec.name
+    mass_from, mass_to = spec.mass_kg
+    distance_from, distance_to = spec.distance_from_sun_km
+    moons_from, moons_to = spec.moons if spec.moons is not None else (0, 0)
+
+    with _mapped(Path(path)) as buffer:
+        for start, end, line_no in _iter_lines(buffer):
+            if line_no <= spec.skip_lines or _is_blank(buffer, start, end):
+                continue
+
+            # Only the stop needs clamping to the line end: a start past it gives an empty slice.
+            planets.append(_make_planet(
+                buffer[start + name_from:min(start + name_to, end)],
+                buffer[start + mass_from:min(start + mass_to, end)],
+                buffer[start + distance_from:min(start + distance_to, end)],
+                buffer[start + moons_from:min(start + moons_to, end)],
+                spec.moon_separator,
+                line_no,
+                source,
+            ))
+
+    return planets
+
+
+def read_csv(path: str | Path, spec: CsvSpec) -> List[Planet]:
+    """
+    Read planets from a delimited (CSV) text file described by 'spec'.
+
+    The file is memory-mapped; each line is scanned for delimiters in place and only the
+    needed fields are sliced out of the mapped buffer.
+    Raises DataValidationError (naming the line) if the header or a record is invalid.
+    """
+    source = str(path)
+    if spec.delimiter == "":
+        raise DataValidationError("CsvSpec.delimiter must not be empty")
+    if spec.moon_separator == "":
+        raise DataValidationError("CsvSpec.moon_separator must not be empty")
+    delimiter = spec.delimiter.encode("utf-8")
+    planets: List[Planet] = []
+
+    with _mapped(Path(path)) as buffer:
+        lines = _iter_lines(buffer)
+
+        header: Dict[str, int] = {}
+        if spec.has_header:
+            first = next(lines, None)
+            if first is not None:
+                text = buffer[first[0]:first[1]].decode("utf-8")  # the header is the only line copied
+                header = {title.strip(): idx for idx, title in enumerate(text.split(spec.delimiter))}
+
+        indexes = [
+            _resolve_column(spec.name, header, source),
+            _resolve_column(spec.mass_kg, header, source),
+            _resolve_column(spec.distance_from_sun_km, header, source),
+            _resolve_column(spec.moons, header, source),
+        ]
+        last_needed = max(idx for idx in indexes if idx is not None)
+
+        for start, end, line_no in lines:
+            if _is_blank(buffer, start, end):
+                continue
+
+            fields = _split_fields(buffer, start, end, delimiter, last_needed)
+            if len(fields) <= last_needed:
+                raise DataValidationError(
+                    f"Line {line_no} of {source} has {len(fields)} field(s); expected at least {last_needed + 1}."
+                )
+
+            planets.append(_make_planet(
+                _csv_field(buffer, fields, indexes[0]),
+                _csv_field(buffer, fields, indexes[1]),
+                _csv_field(buffer, fields, indexes[2]),
+                _csv_field(buffer, fields, indexes[3]),
+                spec.moon_separator,
+                line_no,
+                source,
+            ))
+
+    return planets
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Memory-map a file read-only. Empty files (which cannot be mapped) give b"" instead.
+    """
+    if not path.exists():
+        raise DataValidationError(f"File not found: {path}")
+
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def _iter_lines(buffer: Union[mmap.mmap, bytes]) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield (start, end, line_no) for every line, where buffer[start:end] is the line
+    without its "\n" or "\r\n" ending. Nothing is copied; only offsets are produced.
+    """
+    size = len(buffer)
+    start = 0
+    line_no = 0
+
+    while start < size:
+        newline = buffer.find(b"\n", start)
+        if newline == -1:
+            newline = size
+        end = newline - 1 if newline > start and buffer[newline - 1] == 13 else newline  # 13 is "\r"
+        line_no += 1
+        yield start, end, line_no
+        start = newline + 1
+
+
+def _is_blank(buffer: Union[mmap.mmap, bytes], start: int, end: int) -> bool:
+    """
+    True if buffer[start:end] is empty or only whitespace. Only a line that starts with
+    whitespace is copied to check the rest of it.
+    """
+    return start == end or (buffer[start:start + 1].isspace() and buffer[start:end].isspace())
+
+
+def _resolve_column(column: Optional[Column], header: Dict[str, int], source: str) -> Optional[int]:
+    """
+    Turn a CsvSpec column (index or header name) into a field index.
+    """
+    if isinstance(column, int) and column < 0:
+        raise DataValidationError(f"CSV column indexes must not be negative. Got: {column}")
+    if column is None or isinstance(column, int):
+        return column
+    if column not in header:
+        raise DataValidationError(f"Column {column!r} not found in header of {source}")
+    return header[column]
+
+
+def _split_fields(
+    buffer: Union[mmap.mmap, bytes], start: int, end: int, delimiter: bytes, last_needed: int
+) -> List[Tuple[int, int]]:
+    """
+    Return (start, end) offsets of the fields in buffer[start:end], stopping after field 'last_needed'.
+    """
+    fields: List[Tuple[int, int]] = []
+    pos = start
+
+    while len(fields) <= last_needed:
+        cut = buffer.find(delimiter, pos, end)
+        if cut == -1:
+            fields.append((pos, end))
+            break
+        fields.append((pos, cut))
+        pos = cut + len(delimiter)
+
+    return fields
+
+
+def _csv_field(buffer: Union[mmap.mmap, bytes], fields: List[Tuple[int, int]], idx: Optional[int]) -> bytes:
+    """
+    Slice one CSV field out of the buffer using offsets from _split_fields (b"" for an unused column).
+    """
+    if idx is None:
+        return b""
+    return buffer[fields[idx][0]:fields[idx][1]]
+
+
+def _make_planet(
+    name: bytes,
+    mass_kg: bytes,
+    distance_from_sun_km: bytes,
+    moons: bytes,
+    moon_separator: str,
+    line_no: int,
+    source: str,
+) -> Planet:
+    """
+    Convert raw field bytes into a validated Planet, naming the line in any error.
+    """
+    try:
+        planet_name = name.decode("utf-8").strip()
+        moon_names = [moon.strip() for moon in moons.decode("utf-8").split(moon_separator) if moon.strip()]
+    except UnicodeDecodeError as exc:
+        raise DataValidationError(f"Invalid text on line {line_no} of {source}: {exc}") from exc
+
+    try:
+        return Planet(
+            name=planet_name,
+            mass_kg=_parse_number(mass_kg, "mass_kg"),
+            distance_from_sun_km=_parse_number(distance_from_sun_km, "distance_from_sun_km"),
+            moons=moon_names,
+        )
+    except DataValidationError as exc:
+        raise DataValidationError(f"Invalid data for planet {planet_name!r} on line {line_no} of {source}: {exc}") from exc
+
+
+def _parse_number(raw: bytes, label: str) -> float:
+    """
+    Parse a number field (float() accepts bytes and ignores surrounding whitespace).
+
+    The error does not name the line: _make_planet adds that when it re-raises.
+    """
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise DataValidationError(f"Invalid number {raw.strip()!r} for {label}") from exc
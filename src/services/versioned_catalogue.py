@@ -0,0 +1,107 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+from typing import Dict, Iterable, List, Optional
+
+from src.models.planet import Planet
+from src.services.catalogue import PlanetCatalogue
+from src.utils.errors import DataValidationError, PlanetNotFoundError
+from src.utils.persistent import PersistentMap
+from src.utils.text import normalise_name
+
+
+class VersionedCatalogue:
+    """
+    Keeps every release of the planet data queryable, e.g. the "2019" and "2024" catalogues.
+
+    Each version is a PlanetCatalogue backed by a PersistentMap. A new release only
+    allocates the Planet entries and trie nodes that changed; everything else is shared
+    with the previous version, so 100 releases that each change 1% of the planets cost far
+    less than 100 full catalogues. Versions are read-only and support the usual
+    get/exists/all_names/suggest API, so they can be passed straight to QueryEngine.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, PlanetCatalogue] = {}
+        self._latest: PersistentMap = PersistentMap()
+
+    def commit(
+        self,
+        label: str,
+        upserts: Iterable[Planet] = (),
+        removals: Iterable[str] = (),
+    ) -> PlanetCatalogue:
+        """
+        Record a new version built from the latest one plus a set of changes.
+
+        - upserts: planets to add or replace (matched by normalised name)
+        - removals: names of planets to remove
+        Raises DataValidationError if the label is already used, and PlanetNotFoundError
+        if a removal names a planet that is not in the latest version.
+        """
+        index = self._latest
+
+        for planet in upserts:
+            index = index.set(normalise_name(planet.name), planet)
+
+        for name in removals:
+            try:
+                index = index.delete(normalise_name(name))
+            except KeyError as exc:
+                raise PlanetNotFoundError(f"Planet not found: {name}") from exc
+
+        return self._record(label, index)
+
+    def commit_catalogue(self, label: str, planets: Iterable[Planet]) -> PlanetCatalogue:
+        """
+        Record a full release (e.g. a freshly loaded JSON file) as a new version.
+
+        The release is diffed against the latest version: planets equal to the stored ones
+        keep the existing objects, so only genuinely changed entries use new memory.
+        """
+        release: Dict[str, Planet] = {normalise_name(planet.name): planet for planet in planets}
+        index = self._latest
+
+        for key, planet in release.items():
+            if index.get(key) != planet:
+                index = index.set(key, planet)
+
+        for key in [key for key in index if key not in release]:
+            index = index.delete(key)
+
+        return self._record(label, index)
+
+    def at(self, label: str) -> PlanetCatalogue:
+        """
+        Return the catalogue as it was in the given version.
+
+        Raises DataValidationError if there is no version with that label.
+        """
+        if label not in self._versions:
+            raise DataValidationError(f"Unknown catalogue version: {label}")
+        return self._versions[label]
+
+    def latest(self) -> Optional[PlanetCatalogue]:
+        """
+        Return the most recently committed version, or None if nothing has been committed.
+        """
+        if not self._versions:
+            return None
+        return self._versions[next(reversed(self._versions))]
+
+    def labels(self) -> List[str]:
+        """
+        Return version labels in the order they were committed.
+        """
+        return list(self._versions)
+
+    def _record(self, label: str, index: PersistentMap) -> PlanetCatalogue:
+        """
+        Store 'index' as the version called 'label' and make it the latest.
+        """
+        if label in self._versions:
+            raise DataValidationError(f"Catalogue version already exists: {label}")
+
+        catalogue = PlanetCatalogue._from_index(index)
+        self._versions[label] = catalogue
+        self._latest = index
+        return catalogue
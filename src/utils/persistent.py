@@ -0,0 +1,251 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+from collections.abc import Mapping
+from typing import Any, Hashable, Iterable, Iterator, Optional, Tuple
+
+_BITS = 5  # each trie level consumes 5 hash bits, so a node has up to 32 children
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_MISSING = object()
+
+
+class _BitmapNode:
+    """
+    A trie node storing only the children that exist.
+
+    'bitmap' has bit i set when slot i is used; 'entries' holds the used slots in order.
+    An entry is either a (key, value) tuple (a leaf) or another node.
+    """
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple) -> None:
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _CollisionNode:
+    """
+    Holds (key, value) pairs whose 64-bit hashes are identical, once all hash bits are used up.
+    """
+    __slots__ = ("pairs",)
+
+    def __init__(self, pairs: tuple) -> None:
+        self.pairs = pairs
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class PersistentMap(Mapping):
+    """
+    An immutable mapping with cheap "modified copies" (a hash array mapped trie).
+
+    set() and delete() return a new PersistentMap and leave the original untouched.
+    The new map shares every node that did not change with the old one, so a copy with
+    one changed key only allocates the handful of nodes on the path to that key
+    (about log32(n) of them). Lookups work like any read-only Mapping.
+    """
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Optional[Iterable[Tuple[Hashable, Any]]] = None) -> None:
+        """
+        Create a map, optionally filled from (key, value) pairs (later pairs win).
+        """
+        self._root: Any = _EMPTY_NODE
+        self._size = 0
+
+        if items is not None:
+            for key, value in items:
+                self._root, added = _set(self._root, key, value, _hash(key), 0)
+                if added:
+                    self._size += 1
+
+    def set(self, key: Hashable, value: Any) -> "PersistentMap":
+        """
+        Return a new map with key set to value (self is returned if nothing changes).
+        """
+        root, added = _set(self._root, key, value, _hash(key), 0)
+        if root is self._root:
+            return self
+        return self._make(root, self._size + (1 if added else 0))
+
+    def delete(self, key: Hashable) -> "PersistentMap":
+        """
+        Return a new map without key. Raises KeyError if the key is not present.
+        """
+        root = _delete(self._root, key, _hash(key), 0)
+        if root is None:
+            raise KeyError(key)
+        return self._make(root, self._size - 1)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = _get(self._root, key, _hash(key))
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return _get(self._root, key, _hash(key)) is not _MISSING
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for key, _ in _iter_pairs(self._root):
+            yield key
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self)!r})"
+
+    @classmethod
+    def _make(cls, root: Any, size: int) -> "PersistentMap":
+        """
+        Build a map around an existing root node without re-inserting anything.
+        """
+        new = cls.__new__(cls)
+        new._root = root
+        new._size = size
+        return new
+
+
+def _hash(key: Hashable) -> int:
+    """
+    Return the key's hash as an unsigned 64-bit integer.
+    """
+    return hash(key) & ((1 << _HASH_BITS) - 1)
+
+
+def _slot(bitmap: int, h: int, shift: int) -> Tuple[int, int]:
+    """
+    Return (bit, index): the bitmap bit for this hash at this level, and its position in entries.
+    """
+    bit = 1 << ((h >> shift) & _MASK)
+    return bit, (bitmap & (bit - 1)).bit_count()
+
+
+def _get(node: Any, key: Any, h: int) -> Any:
+    shift = 0
+    while True:
+        if isinstance(node, _CollisionNode):
+            for pair_key, value in node.pairs:
+                if pair_key == key:
+                    return value
+            return _MISSING
+
+        bit, idx = _slot(node.bitmap, h, shift)
+        if not node.bitmap & bit:
+            return _MISSING
+
+        entry = node.entries[idx]
+        if isinstance(entry, tuple):
+            return entry[1] if entry[0] == key else _MISSING
+
+        node = entry
+        shift += _BITS
+
+
+def _set(node: Any, key: Any, value: Any, h: int, shift: int) -> Tuple[Any, bool]:
+    """
+    Return (new_node, added). new_node is 'node' itself when the value is already stored.
+    """
+    if isinstance(node, _CollisionNode):
+        for idx, (pair_key, pair_value) in enumerate(node.pairs):
+            if pair_key == key:
+                if pair_value is value:
+                    return node, False
+                return _CollisionNode(node.pairs[:idx] + ((key, value),) + node.pairs[idx + 1:]), False
+        return _CollisionNode(node.pairs + ((key, value),)), True
+
+    bit, idx = _slot(node.bitmap, h, shift)
+    entries = node.entries
+
+    if not node.bitmap & bit:
+        return _BitmapNode(node.bitmap | bit, entries[:idx] + ((key, value),) + entries[idx:]), True
+
+    entry = entries[idx]
+
+    if isinstance(entry, tuple):
+        if entry[0] == key:
+            if entry[1] is value:
+                return node, False
+            child: Any = (key, value)
+            added = False
+        else:
+            child = _split(entry, _hash(entry[0]), (key, value), h, shift + _BITS)
+            added = True
+    else:
+        child, added = _set(entry, key, value, h, shift + _BITS)
+        if child is entry:
+            return node, added
+
+    return _BitmapNode(node.bitmap, entries[:idx] + (child,) + entries[idx + 1:]), added
+
+
+def _split(first: tuple, first_hash: int, second: tuple, second_hash: int, shift: int) -> Any:
+    """
+    Build the smallest subtree that holds two leaves which collided at the previous level.
+    """
+    if shift >= _HASH_BITS:
+        return _CollisionNode((first, second))
+
+    first_bit = 1 << ((first_hash >> shift) & _MASK)
+    second_bit = 1 << ((second_hash >> shift) & _MASK)
+
+    if first_bit == second_bit:
+        return _BitmapNode(first_bit, (_split(first, first_hash, second, second_hash, shift + _BITS),))
+
+    if first_bit < second_bit:
+        return _BitmapNode(first_bit | second_bit, (first, second))
+    return _BitmapNode(first_bit | second_bit, (second, first))
+
+
+def _delete(node: Any, key: Any, h: int, shift: int) -> Any:
+    """
+    Return the node with key removed, or None if the key was not found.
+
+    A subtree left holding a single leaf is replaced by that leaf so the trie stays compact.
+    """
+    if isinstance(node, _CollisionNode):
+        for idx, (pair_key, _) in enumerate(node.pairs):
+            if pair_key == key:
+                pairs = node.pairs[:idx] + node.pairs[idx + 1:]
+                return pairs[0] if len(pairs) == 1 else _CollisionNode(pairs)
+        return None
+
+    bit, idx = _slot(node.bitmap, h, shift)
+    if not node.bitmap & bit:
+        return None
+
+    entries = node.entries
+    entry = entries[idx]
+
+    if isinstance(entry, tuple):
+        if entry[0] != key:
+            return None
+        remaining = entries[:idx] + entries[idx + 1:]
+        if shift > 0 and len(remaining) == 1 and isinstance(remaining[0], tuple):
+            return remaining[0]
+        return _BitmapNode(node.bitmap & ~bit, remaining)
+
+    child = _delete(entry, key, h, shift + _BITS)
+    if child is None:
+        return None
+
+    if shift > 0 and len(entries) == 1 and isinstance(child, tuple):
+        return child
+    return _BitmapNode(node.bitmap, entries[:idx] + (child,) + entries[idx + 1:])
+
+
+def _iter_pairs(node: Any) -> Iterator[tuple]:
+    """
+    Yield every (key, value) pair below a node.
+    """
+    if isinstance(node, _CollisionNode):
+        yield from node.pairs
+        return
+
+    for entry in node.entries:
+        if isinstance(entry, tuple):
+            yield entry
+        else:
+            yield from _iter_pairs(entry)
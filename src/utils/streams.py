@@ -0,0 +1,227 @@
+# External references for patterns used in this project are listed in README.md and docs/REFERENCES.md
+
+import io
+import json
+import sys
+from typing import Any, BinaryIO, Iterator
+
+from src.utils.errors import DataValidationError
+
+_CHUNK_SIZE = 64 * 1024  # characters decoded per read; only this much text is held beyond the current record
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_VALUE_TERMINATORS = _WHITESPACE + ",]}"
+
+
+def open_decompressed(stream: BinaryIO) -> BinaryIO:
+    """
+    Return a binary stream that yields the decompressed contents of 'stream'.
+
+    The format is detected from the first bytes (magic numbers), not the file name:
+    - gzip: 1f 8b
+    - bz2: "BZh"
+    - xz / lzma: fd "7zXZ" 00, or the legacy .lzma header 5d 00 00
+    Anything else is returned unchanged. Decompression happens lazily as the
+    returned stream is read, so the whole decompressed file is never held in memory.
+    """
+    if not hasattr(stream, "peek"):
+        stream = io.BufferedReader(stream)  # peek() lets us look at the magic bytes without consuming them
+
+    magic = stream.peek(6)[:6]
+
+    if magic.startswith(b"\x1f\x8b"):
+        import gzip
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+
+    if magic.startswith(b"BZh"):
+        import bz2
+        return bz2.BZ2File(stream, mode="rb")
+
+    if magic.startswith(b"\xfd7zXZ\x00") or magic.startswith(b"\x5d\x00\x00"):
+        import lzma
+        return lzma.LZMAFile(stream, mode="rb")
+
+    return stream
+
+
+def iter_json_array(stream: BinaryIO, source: str) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The stream is decoded in fixed-size chunks and each element is parsed with
+    json.JSONDecoder.raw_decode as soon as it is complete, so memory use depends on
+    the largest single element rather than the size of the file.
+    'stream' is left open. Raises DataValidationError if the text is not valid JSON or not a list.
+    """
+    reader = _ChunkedText(stream, source)
+    try:
+        first = reader.next_char()
+        if first == "":
+            raise DataValidationError(f"Invalid JSON in {source}: file is empty")
+        if first != "[":
+            raise DataValidationError(f"Planet data in {source} must be a list of planet objects")
+
+        if reader.peek_char() == "]":
+            reader.next_char()
+        else:
+            while True:
+                yield reader.decode_value()
+
+                separator = reader.next_char()
+                if separator == "]":
+                    break
+                if separator != ",":
+                    raise DataValidationError(
+                        f"Invalid JSON in {source}: expected ',' or ']' at char {reader.position()}"
+                    )
+
+        if reader.next_char() != "":
+            raise DataValidationError(f"Invalid JSON in {source}: extra data at char {reader.position()}")
+    finally:
+        reader.detach()  # otherwise closing (or collecting) the wrapper closes 'stream' too
+
+
+def iter_json_lines(stream: BinaryIO, source: str) -> Iterator[Any]:
+    """
+    Yield one decoded JSON value per non-blank line (JSON Lines format).
+
+    Lines are read one at a time; 'stream' is left open. Raises DataValidationError
+    naming the line number if a line is not valid JSON.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8")
+    try:
+        line_no = 0
+
+        while True:
+            try:
+                line = text.readline()
+            except _read_errors() as exc:
+                raise DataValidationError(f"Could not read {source}: {exc}") from exc
+
+            if line == "":
+                return
+
+            line_no += 1
+            if line.strip() == "":
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError as exc:  # JSONDecodeError, or an integer with too many digits to convert
+                raise DataValidationError(f"Invalid JSON in {source} on line {line_no}: {exc}") from exc
+    finally:
+        text.detach()  # otherwise closing (or collecting) the wrapper closes 'stream' too
+
+
+def _read_errors() -> tuple:
+    """
+    Return the exception types that mean "the (possibly compressed) input is broken".
+
+    zlib.error (corrupt gzip/deflate data) and lzma.LZMAError are only included if those
+    modules have already been imported (gzip imports zlib; open_decompressed imports lzma),
+    so plain JSON loading never pays for importing them.
+    """
+    errors: tuple = (OSError, EOFError, UnicodeDecodeError)
+    zlib = sys.modules.get("zlib")
+    if zlib is not None:
+        errors = errors + (zlib.error,)
+    lzma = sys.modules.get("lzma")
+    if lzma is not None:
+        errors = errors + (lzma.LZMAError,)
+    return errors
+
+
+class _ChunkedText:
+    """
+    A small cursor over a text stream that only keeps the unparsed tail of the data in memory.
+    """
+
+    def __init__(self, stream: BinaryIO, source: str) -> None:
+        self._text = io.TextIOWrapper(stream, encoding="utf-8")
+        self._source = source
+        self._buffer = ""
+        self._pos = 0
+        self._discarded = 0  # characters dropped from the front of the buffer (for error positions)
+        self._eof = False
+
+    def detach(self) -> None:
+        """
+        Release the underlying binary stream without closing it.
+        """
+        self._text.detach()
+
+    def position(self) -> int:
+        """
+        Return the absolute character offset of the cursor (used in error messages).
+        """
+        return self._discarded + self._pos
+
+    def peek_char(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it ('' at end of input).
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def next_char(self) -> str:
+        """
+        Skip whitespace and consume the next character ('' at end of input).
+        """
+        char = self.peek_char()
+        if char != "":
+            self._pos += 1
+        return char
+
+    def decode_value(self) -> Any:
+        """
+        Decode one JSON value starting at the cursor, reading more text until it is complete.
+        """
+        self.peek_char()
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise DataValidationError(
+                    f"Invalid JSON in {self._source}: {exc.msg} at char {self._discarded + exc.pos}"
+                ) from exc
+            except ValueError as exc:  # an integer with more digits than int() will convert
+                raise DataValidationError(f"Invalid JSON in {self._source}: {exc}") from exc
+
+            # A number cut by a chunk boundary still decodes (e.g. "1500." -> 1500), so only
+            # accept a value once the character after it shows that it really ended there.
+            if (end == len(self._buffer) or self._buffer[end] not in _VALUE_TERMINATORS) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+    def _fill(self) -> bool:
+        """
+        Append the next chunk of text to the buffer, dropping the already-consumed prefix.
+
+        Returns False at end of input.
+        """
+        if self._eof:
+            return False
+
+        try:
+            chunk = self._text.read(_CHUNK_SIZE)
+        except _read_errors() as exc:
+            raise DataValidationError(f"Could not read {self._source}: {exc}") from exc
+
+        if chunk == "":
+            self._eof = True
+            return False
+
+        self._discarded += self._pos
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
@@ -1,6 +1,3 @@
-import re
-
-
 def normalise_name(name: str) -> str:
     """
     Normalise a planet name for consistent formatting/matching.
@@ -8,5 +5,5 @@ def normalise_name(name: str) -> str:
     """
 
     name = name.strip().lower()
-    name = re.sub(r"\s+", " ", name)  # Replace multiple spaces with a single space
-    return name
\ No newline at end of file
+    name = " ".join(name.split())  # Replace runs of whitespace with a single space (no need for re)
+    return name
@@ -0,0 +1,150 @@
+import random
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.models.answer import Intent
+from src.models.planet import Planet
+from src.services.aggregates import DISTANCE, MASS, MOONS, CatalogueAggregates
+from src.services.catalogue import PlanetCatalogue
+from src.services.query_parser import QueryEngine
+from src.services.shared_catalogue import SharedCatalogue
+from src.services.versioned_catalogue import VersionedCatalogue
+from src.utils.errors import DataValidationError, PlanetError, PlanetNotFoundError
+from tests.test_query_parser import build_catalogue
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "planets.json"
+
+
+def snapshot(aggregates: CatalogueAggregates) -> tuple:
+    return (
+        aggregates.count(),
+        tuple(aggregates.total(field) for field in (MASS, DISTANCE, MOONS)),
+        tuple(aggregates.minimum(field) for field in (MASS, DISTANCE, MOONS)),
+        tuple(aggregates.maximum(field) for field in (MASS, DISTANCE, MOONS)),
+        tuple(aggregates.histogram(field) for field in (MASS, DISTANCE, MOONS)),
+    )
+
+
+class TestCatalogueAggregates(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalogue = build_catalogue()
+        self.engine = QueryEngine()
+
+    def test_initial_statistics(self) -> None:
+        stats = self.catalogue.aggregates()
+        self.assertEqual(stats.count(), 4)
+        self.assertEqual(stats.total(MOONS), 6)
+        self.assertEqual(stats.maximum(MASS), (5.683e26, "Saturn"))
+        self.assertEqual(stats.minimum(DISTANCE), (149600000, "Earth"))
+        self.assertEqual(stats.histogram(MOONS), {1: 2, 2: 2})
+        self.assertEqual(stats.histogram(MASS), {23: 1, 24: 1, 26: 2})
+        self.assertEqual(stats.planets_without_moons(), 0)
+
+    def test_updates_match_a_full_recompute(self) -> None:
+        rng = random.Random(3)
+        for step in range(200):
+            names = self.catalogue.all_names()
+            action = rng.choice(["add", "remove", "replace"]) if names else "add"
+            if action == "add":
+                self.catalogue.add(Planet(
+                    name=f"P{step}",
+                    mass_kg=rng.choice([1e22, 3.5e24, 7e26]),
+                    distance_from_sun_km=rng.uniform(1e7, 1e10),
+                    moons=[f"M{step}-{idx}" for idx in range(rng.randint(0, 3))],
+                ))
+            elif action == "remove":
+                self.catalogue.remove(rng.choice(names))
+            else:
+                old = self.catalogue.get(rng.choice(names))
+                self.catalogue.replace(Planet(name=old.name, mass_kg=old.mass_kg * 2, distance_from_sun_km=old.distance_from_sun_km, moons=[]))
+
+        expected = CatalogueAggregates.from_planets(self.catalogue.get(name) for name in self.catalogue.all_names())
+        incremental = snapshot(self.catalogue.aggregates())
+        recomputed = snapshot(expected)
+        self.assertEqual(incremental[0], recomputed[0])
+        for got, want in zip(incremental[1], recomputed[1]):
+            self.assertAlmostEqual(got, want, delta=abs(want) * 1e-9)
+        self.assertEqual(incremental[2:], recomputed[2:])
+
+    def test_mutation_errors(self) -> None:
+        with self.assertRaises(DataValidationError):
+            self.catalogue.add(Planet(name="  EARTH ", mass_kg=1.0, distance_from_sun_km=1.0, moons=[]))
+        with self.assertRaises(PlanetNotFoundError):
+            self.catalogue.remove("Pluto")
+
+        versions = VersionedCatalogue()
+        versions.commit("v1", [self.catalogue.get("earth")])
+        with self.assertRaises(PlanetError):
+            versions.latest().remove("earth")
+        self.assertEqual(versions.latest().aggregates().count(), 1)
+
+    def test_aggregate_questions(self) -> None:
+        ask = lambda question: self.engine.answer(question, self.catalogue)
+
+        self.assertEqual(ask("How many planets are there?"), "There are 4 planet(s) in the list.")
+        self.assertEqual(ask("How many moons are there in total?"), "There are 6 moon(s) in total across 4 planet(s).")
+        self.assertEqual(ask("Which is the heaviest planet?"), "The most massive planet is Saturn (5.683e+26 kg).")
+        self.assertEqual(ask("What is the closest planet to the Sun?"), "The closest planet to the Sun is Earth (149,600,000 km).")
+        self.assertIn("Average planet mass (kg):", ask("What is the average mass?"))
+        self.assertEqual(ask("What is the total mass?"), "Total mass of 4 planet(s) (kg): 6.773e+26")
+        self.assertEqual(ask("How are the moons distributed?"), "Planets by number of moons: 1: 2, 2: 2")
+        self.assertEqual(ask("Show the mass distribution"), "Planets by mass (kg): 1e23: 1, 1e24: 1, 1e26: 2")
+
+        self.catalogue.add(Planet(name="Vulcan", mass_kg=1e22, distance_from_sun_km=2e7, moons=[]))
+        self.assertEqual(ask("How many planets have no moons?"), "1 planet(s) have no moons.")
+        self.assertEqual(ask("Which planet is the lightest?"), "The least massive planet is Vulcan (1.000e+22 kg).")
+
+        # Questions about one planet still go to the per-planet intents.
+        self.assertIn("Earth has 1 moon", ask("How many moons does Earth have"))
+
+    def test_questions_naming_a_planet_stay_about_that_planet(self) -> None:
+        catalogue = PlanetCatalogue.from_json(DATA_PATH)
+        expected = {
+            "How many moons does Jupiter have in total?": "Jupiter has 4 moon(s).",
+            "What is the mean distance of Mars from the sun": "Mars distance from Sun (km): 227,900,000",
+            "What is the average weight of Earth": "Earth mass (kg): 5.972e+24",
+            "Is Jupiter the largest planet?": "Yes, Jupiter is in the planet list.",
+            "List moons of neptune combined": "Neptune moons: Triton, Proteus, Nereid",
+            "how many planets does saturn have": self.engine.answer("saturn please", catalogue),
+            # A misspelt name or an "is X ..." question is not a catalogue-wide question either.
+            "What is the mean distance of Marss": "Planet not found. Did you mean: Mars?",
+            "What is the average mass of Satrun": "Planet not found. Did you mean: Saturn?",
+            "Is Pluto the smallest planet": "No, pluto is not in the planet list.",
+            # A superlative picks the planet; the rest of the question says what to tell about it.
+            "Which moons does the closest planet have": "Mercury has no moons.",
+            "How many moons does the biggest planet have": "Jupiter has 4 moon(s).",
+            "How far is the heaviest planet": "Jupiter distance from Sun (km): 778,500,000",
+        }
+        for question, answer in expected.items():
+            self.assertEqual(self.engine.answer(question, catalogue), answer, question)
+
+        self.assertIn("did not understand", expected["how many planets does saturn have"])
+        self.assertNotEqual(self.engine.ask("How many planets have moons", catalogue).intent, Intent.PLANET_COUNT)
+
+    def test_structured_answer_and_shared_catalogue(self) -> None:
+        answer = self.engine.ask("Which planet is farthest from the Sun?", self.catalogue)
+        self.assertEqual(answer.to_dict()["planet"], "Neptune")
+        self.assertEqual(answer.values, {DISTANCE: 4495100000})
+
+        shared = SharedCatalogue.create(self.catalogue)
+        try:
+            # Read from the segment: no Planet is rebuilt to answer a catalogue-wide question.
+            with mock.patch.object(SharedCatalogue, "get", side_effect=AssertionError("rebuilt a Planet")):
+                self.assertEqual(snapshot(shared.aggregates()), snapshot(self.catalogue.aggregates()))
+                self.assertEqual(self.engine.answer("how many planets are there", shared), "There are 4 planet(s) in the list.")
+        finally:
+            shared.close()
+            shared.unlink()
+
+        empty = SharedCatalogue.create(PlanetCatalogue([]))
+        try:
+            self.assertEqual(snapshot(empty.aggregates()), snapshot(CatalogueAggregates()))
+            self.assertEqual(self.engine.answer("Which is the heaviest planet?", empty), "There are no planets in the list.")
+        finally:
+            empty.close()
+            empty.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
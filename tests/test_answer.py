@@ -0,0 +1,46 @@
+import json
+import unittest
+from unittest import mock
+
+from src.models.answer import AnswerStatus, Intent
+from src.services.query_parser import QueryEngine
+from tests.test_query_parser import build_catalogue
+
+
+class TestStructuredAnswer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalogue = build_catalogue()
+        self.engine = QueryEngine()
+
+    def test_mass_answer_has_numeric_value(self) -> None:
+        result = self.engine.ask("How massive is Mars", self.catalogue)
+        self.assertEqual(result.status, AnswerStatus.OK)
+        self.assertEqual(result.intent, Intent.MASS)
+        self.assertEqual(result.planet.name, "Mars")
+        self.assertEqual(result.values, {"mass_kg": 6.417e23})
+
+    def test_ask_does_not_format_text(self) -> None:
+        with mock.patch("src.services.formatter.format_answer") as format_answer:
+            result = self.engine.ask("List the moons of Mars", self.catalogue)
+            result.to_json()
+        format_answer.assert_not_called()
+        self.assertEqual(result.values["moons"], ["Phobos", "Deimos"])
+
+    def test_to_json_round_trips(self) -> None:
+        result = self.engine.ask("Is Pluto in the list of planets", self.catalogue)
+        data = json.loads(result.to_json())
+        self.assertEqual(data["intent"], "membership")
+        self.assertIsNone(data["planet"])
+        self.assertEqual(data["values"], {"name": "pluto", "in_list": False})
+
+    def test_unknown_planet_carries_suggestions(self) -> None:
+        result = self.engine.ask("How massive is saturnn", self.catalogue)
+        self.assertEqual(result.status, AnswerStatus.PLANET_NOT_FOUND)
+        self.assertEqual(result.suggestions, ["Saturn"])
+
+    def test_render_matches_answer(self) -> None:
+        question = "Tell me everything about Saturn"
+        self.assertEqual(
+            self.engine.ask(question, self.catalogue).render(),
+            self.engine.answer(question, self.catalogue),
+        )
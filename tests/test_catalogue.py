@@ -74,3 +74,58 @@ class TestPlanetCatalogue(unittest.TestCase):
 
         self.assertTrue(len(suggestions) >= 1)
         self.assertEqual(suggestions[0], "Saturn")
+
+    def test_from_directory_merges_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            (directory / "inner.json").write_text(
+                json.dumps([{"name": "Earth", "mass_kg": 5.972e24, "distance_from_sun_km": 149600000}]),
+                encoding="utf-8",
+            )
+            (directory / "outer.json").write_text(
+                json.dumps([{"name": "Saturn", "mass_kg": 5.683e26, "distance_from_sun_km": 1433500000}]),
+                encoding="utf-8",
+            )
+
+            for workers in (1, 2):
+                catalogue = PlanetCatalogue.from_directory(directory, max_workers=workers)
+                self.assertEqual(catalogue.all_names(), ["Earth", "Saturn"])
+
+    def test_from_directory_duplicate_name_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            entry = {"name": "Earth", "mass_kg": 5.972e24, "distance_from_sun_km": 149600000}
+            (directory / "a.json").write_text(json.dumps([entry]), encoding="utf-8")
+            (directory / "b.json").write_text(json.dumps([dict(entry, name=" EARTH ")]), encoding="utf-8")
+
+            with self.assertRaises(DataValidationError) as ctx:
+                PlanetCatalogue.from_directory(directory, max_workers=2)
+
+            self.assertIn("b.json", str(ctx.exception))
+            self.assertIn("a.json", str(ctx.exception))
+
+    def test_from_directory_error_names_file_and_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            good = {"name": "Earth", "mass_kg": 5.972e24, "distance_from_sun_km": 149600000}
+            bad = {"name": "Mars", "distance_from_sun_km": 227900000}
+            (directory / "shard.json").write_text(json.dumps([good, bad]), encoding="utf-8")
+
+            with self.assertRaises(DataValidationError) as ctx:
+                PlanetCatalogue.from_directory(directory, max_workers=2)
+
+            self.assertIn("index 1", str(ctx.exception))
+            self.assertIn("shard.json", str(ctx.exception))
+
+    def test_numbers_too_large_for_a_float_raise(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            too_large = '[{"name": "Earth", "mass_kg": 1%s, "distance_from_sun_km": 149600000}]'
+            (directory / "big.json").write_text(too_large % ("0" * 400), encoding="utf-8")
+            (directory / "huge.json").write_text(too_large % ("0" * 5000), encoding="utf-8")  # past int()'s digit limit
+
+            for path in sorted(directory.iterdir()):
+                with self.assertRaises(DataValidationError, msg=path.name):
+                    PlanetCatalogue.from_json(path)
+            with self.assertRaises(DataValidationError):
+                PlanetCatalogue.from_directory(directory, max_workers=1)
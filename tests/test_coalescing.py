@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.services.coalescing import CoalescingQueryEngine, SingleFlight
+from src.services.query_parser import QueryEngine
+from tests.test_query_parser import build_catalogue
+
+
+def wait_for_requests(flight: SingleFlight, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while flight.stats().requests < count:
+        if time.monotonic() > deadline:
+            raise AssertionError("callers did not arrive in time")
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_threads_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute() -> int:
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("key", compute))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        wait_for_requests(flight, 8)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [42] * 8)
+        self.assertEqual(len(calls), 1)
+        stats = flight.stats()
+        self.assertEqual((stats.requests, stats.executions, stats.coalesced), (8, 1, 7))
+
+    def test_error_is_shared_and_not_cached(self) -> None:
+        flight = SingleFlight()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            flight.do("key", fail)
+        self.assertEqual(flight.do("key", lambda: "ok"), "ok")
+        self.assertEqual(flight.stats().executions, 2)
+
+    def test_asyncio_tasks_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute() -> str:
+            calls.append(1)
+            release.wait(5)
+            return "done"
+
+        async def run() -> list:
+            tasks = [asyncio.create_task(flight.do_async("key", compute)) for _ in range(5)]
+            while flight.stats().requests < 5:
+                await asyncio.sleep(0.001)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        self.assertEqual(asyncio.run(run()), ["done"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats().coalesced, 4)
+
+    def test_cancelling_the_first_caller_does_not_cancel_the_others(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def compute() -> str:
+            release.wait(5)
+            return "done"
+
+        async def run() -> str:
+            leader = asyncio.create_task(flight.do_async("key", compute))
+            follower = asyncio.create_task(flight.do_async("key", compute))
+            while flight.stats().requests < 2:
+                await asyncio.sleep(0.001)
+
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            release.set()
+            return await follower
+
+        self.assertEqual(asyncio.run(run()), "done")
+        self.assertEqual(flight.stats().executions, 1)
+
+
+class TestCoalescingQueryEngine(unittest.TestCase):
+    def test_answers_match_query_engine(self) -> None:
+        catalogue = build_catalogue()
+        engine = CoalescingQueryEngine()
+
+        self.assertEqual(
+            engine.answer("How massive is Neptune", catalogue),
+            QueryEngine().answer("How massive is Neptune", catalogue),
+        )
+        answer = asyncio.run(engine.answer_async("  how MANY moons does earth have ", catalogue))
+        self.assertIn("Earth has 1 moon", answer)
+        self.assertEqual(engine.stats().requests, 2)
@@ -0,0 +1,67 @@
+import random
+import unittest
+from unittest import mock
+
+from src.models.planet import Planet
+from src.main import prompt_planet_name
+from src.services.completion import CompletionIndex
+from tests.test_query_parser import build_catalogue
+
+
+class TestCompletionIndex(unittest.TestCase):
+    def test_catalogue_completes_by_prefix(self) -> None:
+        catalogue = build_catalogue()
+        self.assertEqual(catalogue.complete("SA"), ["Saturn"])
+        self.assertEqual(catalogue.complete("x"), [])
+        # Empty prefix: everything, most massive first.
+        self.assertEqual(catalogue.complete("", limit=2), ["Saturn", "Neptune"])
+
+    def test_ranked_by_weight_then_name(self) -> None:
+        index = CompletionIndex([("Mars", 1.0), ("Makemake", 5.0), ("Mab", 5.0), ("Moon", 3.0), ("Earth", 9.0)])
+        self.assertEqual(index.complete("m"), ["Mab", "Makemake", "Moon", "Mars"])
+        self.assertEqual(index.complete("ma", limit=2), ["Mab", "Makemake"])
+
+    def test_moons_and_multi_word_names(self) -> None:
+        planets = [
+            Planet(name="Saturn", mass_kg=5.683e26, distance_from_sun_km=1433500000, moons=["Titan"]),
+            Planet(name="Planet  Nine", mass_kg=3.0e25, distance_from_sun_km=6.0e10, moons=[]),
+        ]
+        index = CompletionIndex.from_planets(planets, include_moons=True)
+        self.assertEqual(index.complete("ti"), ["Titan"])
+        self.assertEqual(index.complete("planet n"), ["Planet  Nine"])
+
+    def test_prompt_restores_readline_settings(self) -> None:
+        try:
+            import readline
+        except ImportError:
+            self.skipTest("readline is not available")
+
+        self.addCleanup(readline.set_completer_delims, readline.get_completer_delims())
+        self.addCleanup(readline.set_completer, readline.get_completer())
+        previous = lambda text, state: None
+        readline.set_completer(previous)
+        readline.set_completer_delims(" \t\n")
+
+        def answer(prompt: str) -> str:
+            self.assertEqual(readline.get_completer_delims(), "")  # whole-line completion while prompting
+            return "Saturn"
+
+        with mock.patch("builtins.input", side_effect=answer), mock.patch("builtins.print"):
+            self.assertEqual(prompt_planet_name("Planet: ", build_catalogue()), "Saturn")
+
+        self.assertIs(readline.get_completer(), previous)
+        self.assertEqual(readline.get_completer_delims(), " \t\n")
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(7)
+        entries = [("".join(rng.choice("abc") for _ in range(rng.randint(1, 5))), float(rng.randint(0, 20))) for _ in range(300)]
+        index = CompletionIndex(entries)
+
+        best = {}
+        for name, weight in entries:
+            if name not in best or weight > best[name]:
+                best[name] = weight
+
+        for prefix in ["", "a", "ab", "cab", "ccccc"]:
+            expected = sorted((name for name in best if name.startswith(prefix)), key=lambda name: (-best[name], name))
+            self.assertEqual(index.complete(prefix, limit=7), expected[:7])
@@ -0,0 +1,98 @@
+import json
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.services.diagnostics import (
+    build_report,
+    diff_reports,
+    find_regressions,
+    format_report,
+    main,
+    measure_components,
+    profile_questions,
+    report_to_json,
+)
+from tests.test_query_parser import build_catalogue
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "planets.json"
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_report_structure(self) -> None:
+        report = build_report(DATA_PATH, ["How massive is Neptune", "Is Pluto a planet"])
+        load = report["catalogue"]
+
+        self.assertEqual(load["planets"], 8)
+        self.assertGreater(load["retained_bytes"], 0)
+        self.assertGreaterEqual(load["peak_bytes"], load["retained_bytes"])
+        components = dict(load["components"])
+        other = components.pop("other")
+        self.assertTrue(all(size > 0 for size in components.values()), components)
+        # The named components should explain nearly all retained memory.
+        self.assertLess(abs(other), load["retained_bytes"] * 0.25, load)
+        self.assertTrue(all(site["site"].startswith("src/") for site in load["top_sites"]))
+
+        self.assertEqual([result["question"] for result in report["questions"]], ["How massive is Neptune", "Is Pluto a planet"])
+        self.assertFalse(tracemalloc.is_tracing())  # stopped again afterwards
+
+        # The JSON form is stable and readable back.
+        self.assertEqual(json.loads(report_to_json(report)), report)
+        self.assertIn("Per question", format_report(report))
+
+    def test_components(self) -> None:
+        sizes = measure_components(build_catalogue())
+        self.assertEqual(set(sizes), {
+            "planet_objects", "planet_names", "moon_lists", "moon_names", "numbers", "index_dict", "index_keys",
+        })
+        self.assertTrue(all(size > 0 for size in sizes.values()))
+
+    def test_questions_leave_tracing_to_the_caller(self) -> None:
+        tracemalloc.start()
+        try:
+            results = profile_questions(build_catalogue(), ["How far is Mars from the Sun"])
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(results[0]["peak_bytes"], 0)
+
+    def test_warmup_excludes_one_off_costs(self) -> None:
+        question = ["How many planets are there"]
+        cold = profile_questions(build_catalogue(), question, warmup=False)[0]  # builds the aggregates
+        warm = profile_questions(build_catalogue(), question, warmup=True)[0]
+        self.assertLess(warm["retained_bytes"], cold["retained_bytes"])
+
+    def test_diff_and_regressions(self) -> None:
+        old = {"catalogue": {"retained_bytes": 10000, "peak_bytes": 20000, "components": {"moon_names": 4000}},
+               "questions": [{"question": "q", "peak_bytes": 1000, "retained_bytes": 0}]}
+        new = {"catalogue": {"retained_bytes": 15000, "peak_bytes": 20500, "components": {"moon_names": 4000}},
+               "questions": [{"question": "q", "peak_bytes": 1000, "retained_bytes": 2048}]}
+
+        rows = {row["metric"]: row for row in diff_reports(old, new)}
+        self.assertEqual(rows["catalogue.retained_bytes"]["change"], 5000)
+        self.assertEqual(rows["catalogue.retained_bytes"]["percent"], 50.0)
+        self.assertIsNone(rows["questions[q].retained_bytes"]["percent"])
+
+        regressed = [row["metric"] for row in find_regressions(list(rows.values()), threshold_percent=10)]
+        # peak_bytes grew 2.5% and 500 bytes: below both limits.
+        self.assertEqual(sorted(regressed), ["catalogue.retained_bytes", "questions[q].retained_bytes"])
+
+
+    def test_cli_reports_unreadable_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            broken = Path(tmpdir) / "old.json"
+            broken.write_text("{not json", encoding="utf-8")
+
+            for option, path in [("--questions-file", Path(tmpdir) / "missing.txt"), ("--compare", broken)]:
+                argv = ["diagnostics", "--data", str(DATA_PATH), option, str(path)]
+                with mock.patch("sys.argv", argv), mock.patch("builtins.print") as printed:
+                    with self.assertRaises(SystemExit) as ctx:
+                        main()
+                self.assertEqual(ctx.exception.code, 2, option)
+                self.assertIn("Error reading", printed.call_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from src.utils.persistent import PersistentMap
+
+
+class CollidingKey:
+    """A key type whose instances all share one hash, to exercise collision nodes."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __hash__(self) -> int:
+        return 7
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+
+class TestPersistentMap(unittest.TestCase):
+    def test_matches_dict_under_random_operations(self) -> None:
+        rng = random.Random(1)
+        expected = {}
+        current = PersistentMap()
+
+        for _ in range(3000):
+            key = f"k{rng.randrange(500)}"
+            if key in expected and rng.random() < 0.4:
+                del expected[key]
+                current = current.delete(key)
+            else:
+                expected[key] = rng.random()
+                current = current.set(key, expected[key])
+
+        self.assertEqual(len(current), len(expected))
+        self.assertEqual(dict(current), expected)
+
+    def test_old_versions_are_unchanged(self) -> None:
+        first = PersistentMap([("earth", 1), ("mars", 2)])
+        second = first.set("earth", 10).delete("mars")
+
+        self.assertEqual(dict(first), {"earth": 1, "mars": 2})
+        self.assertEqual(dict(second), {"earth": 10})
+        self.assertIs(first.set("mars", 2), first)
+
+    def test_hash_collisions(self) -> None:
+        keys = [CollidingKey(name) for name in "abc"]
+        current = PersistentMap((key, key.name) for key in keys)
+
+        self.assertEqual(current[CollidingKey("b")], "b")
+        current = current.delete(CollidingKey("b"))
+        self.assertNotIn(CollidingKey("b"), current)
+        self.assertEqual(sorted(current.values()), ["a", "c"])
+
+    def test_missing_key_raises(self) -> None:
+        with self.assertRaises(KeyError):
+            PersistentMap()["pluto"]
+        with self.assertRaises(KeyError):
+            PersistentMap().delete("pluto")
@@ -50,3 +50,10 @@ class TestPlanetModel(unittest.TestCase):
                 distance_from_sun_km=1.0,
                 moons="Moon",  # type: ignore[arg-type]
             )
+
+    def test_non_finite_numbers_raise(self) -> None:
+        for value in [float("nan"), float("inf"), 10 ** 400]:  # the int is too large for a float
+            with self.assertRaises(DataValidationError):
+                Planet(name="Earth", mass_kg=value, distance_from_sun_km=1.0, moons=[])
+            with self.assertRaises(DataValidationError):
+                Planet(name="Earth", mass_kg=1.0, distance_from_sun_km=value, moons=[])
@@ -78,3 +78,23 @@ class TestQueryEngine(unittest.TestCase):
         answer = self.engine.answer("How massive is saturnn", self.catalogue)
         lowered = answer.lower()
         self.assertTrue(("did you mean" in lowered) or ("saturn" in lowered))
+
+    def test_long_question_scan_is_bounded(self) -> None:
+        class CountingCatalogue(PlanetCatalogue):
+            lookups = 0
+
+            def exists(self, name: str) -> bool:
+                CountingCatalogue.lookups += 1
+                return super().exists(name)
+
+        catalogue = CountingCatalogue([
+            Planet(name="Mars", mass_kg=6.417e23, distance_from_sun_km=227900000, moons=[]),
+            Planet(name="Planet Nine", mass_kg=3.0e25, distance_from_sun_km=6.0e10, moons=[]),
+        ])
+        self.assertEqual(catalogue.max_name_words(), 2)
+
+        words = ["word"] * 2000 + ["planet", "nine"]
+        answer = self.engine.answer("How massive is " + " ".join(words), catalogue)
+        self.assertIn("Planet Nine", answer)
+        # At most max_name_words() lookups per word, not one per pair of words.
+        self.assertLess(CountingCatalogue.lookups, 2 * (len(words) + 3) + 10)
@@ -0,0 +1,165 @@
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import struct
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.models.planet import Planet
+from src.server import MAX_LINE, PreforkServer
+from src.services.catalogue import PlanetCatalogue
+from src.services.query_parser import QueryEngine
+from src.services.shared_catalogue import SharedCatalogue
+from src.utils.errors import PlanetNotFoundError
+from tests.test_query_parser import build_catalogue
+
+HAS_FORK = "fork" in multiprocessing.get_all_start_methods()
+HAS_PROC = Path("/proc/self/status").exists()
+
+
+def read_status_kib(field: str) -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+def measure_worker(shared_name: str, questions: list, results) -> None:
+    """Worker body for the RSS test: attach, answer questions, report private/shared memory growth."""
+    anon_before = read_status_kib("RssAnon")
+    shmem_before = read_status_kib("RssShmem")
+
+    catalogue = SharedCatalogue.attach(shared_name)
+    engine = QueryEngine()
+    for question in questions:
+        engine.ask(question, catalogue)
+
+    results.put((read_status_kib("RssAnon") - anon_before, read_status_kib("RssShmem") - shmem_before))
+    catalogue.close()
+
+
+def large_catalogue(count: int) -> PlanetCatalogue:
+    return PlanetCatalogue([
+        Planet(
+            name=f"Body {idx}",
+            mass_kg=1.0e20 + idx,
+            distance_from_sun_km=1.0e8 + idx,
+            moons=[f"Moon {idx}-a", f"Moon {idx}-b"],
+        )
+        for idx in range(count)
+    ])
+
+
+class TestSharedCatalogue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalogue = build_catalogue()
+        self.shared = SharedCatalogue.create(self.catalogue)
+        self.addCleanup(self.shared.unlink)
+        self.addCleanup(self.shared.close)
+
+    def test_lookups_match_catalogue(self) -> None:
+        attached = SharedCatalogue.attach(self.shared.name)
+        self.addCleanup(attached.close)
+
+        self.assertEqual(attached.all_names(), self.catalogue.all_names())
+        self.assertEqual(attached.get(" MARS "), self.catalogue.get("mars"))
+        self.assertTrue(attached.exists("neptune"))
+        self.assertFalse(attached.exists("pluto"))
+        self.assertEqual(attached.suggest("saturnn"), ["Saturn"])
+        with self.assertRaises(PlanetNotFoundError):
+            attached.get("pluto")
+
+    def test_suggest_decodes_keys_once(self) -> None:
+        self.assertEqual(self.shared.suggest("marss"), self.catalogue.suggest("marss"))
+
+        with mock.patch.object(SharedCatalogue, "_string", autospec=True, side_effect=SharedCatalogue._string) as decode:
+            self.assertEqual(self.shared.suggest("neptunee"), ["Neptune"])
+        self.assertEqual(decode.call_count, 1)  # only the matched name, not the key table again
+
+    def test_query_engine_answers_match(self) -> None:
+        engine = QueryEngine()
+        for question in ["Tell me everything about Saturn", "Is Pluto in the list of planets", "How far is marss"]:
+            self.assertEqual(engine.answer(question, self.shared), engine.answer(question, self.catalogue))
+
+
+@unittest.skipUnless(HAS_FORK and HAS_PROC, "needs fork and /proc (Linux)")
+class TestPreforkServer(unittest.TestCase):
+    def test_workers_answer_over_tcp(self) -> None:
+        server = PreforkServer(build_catalogue(), workers=2)
+        server.start()
+        self.addCleanup(server.stop)
+
+        with socket.create_connection(server.address, timeout=10) as connection:
+            stream = connection.makefile("rwb")
+            stream.write(b"How many moons does Mars have\n")
+            stream.flush()
+            reply = json.loads(stream.readline())
+
+        self.assertEqual(reply["values"], {"moon_count": 2})
+        self.assertEqual(reply["text"], "Mars has 2 moon(s).")
+
+    def test_worker_survives_reset_connections_and_is_restarted(self) -> None:
+        server = PreforkServer(build_catalogue(), workers=1)
+        server.start()
+        self.addCleanup(server.stop)
+
+        # A client that floods questions without reading replies, then resets the connection.
+        with socket.create_connection(server.address, timeout=10) as rude:
+            rude.sendall(b"How many moons does Mars have\n" * 20000)
+            rude.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+
+        self.assertEqual(self.ask(server, "How far is Mars from the Sun")["status"], "ok")
+
+        os.kill(server.worker_pids[0], signal.SIGKILL)
+        server._processes[0].join()
+        self.assertEqual(server.restart_dead_workers(), 1)
+        self.assertEqual(self.ask(server, "How many moons does Mars have")["text"], "Mars has 2 moon(s).")
+
+    def test_overlong_line_is_rejected(self) -> None:
+        server = PreforkServer(build_catalogue(), workers=1)
+        server.start()
+        self.addCleanup(server.stop)
+
+        with socket.create_connection(server.address, timeout=10) as connection:
+            stream = connection.makefile("rwb")
+            stream.write(b"x" * (MAX_LINE * 4))  # no newline at all
+            stream.flush()
+            reply = json.loads(stream.readline())
+            self.assertEqual(reply["status"], "error")
+            self.assertEqual(stream.readline(), b"")  # disconnected
+
+        self.assertEqual(self.ask(server, "Tell me about Mars " + "x" * (MAX_LINE - 100))["status"], "ok")
+
+    def ask(self, server: PreforkServer, question: str) -> dict:
+        with socket.create_connection(server.address, timeout=10) as connection:
+            stream = connection.makefile("rwb")
+            stream.write(question.encode("utf-8") + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+    def test_per_worker_rss_stays_flat(self) -> None:
+        shared = SharedCatalogue.create(large_catalogue(100000))
+        self.addCleanup(shared.unlink)
+        self.addCleanup(shared.close)
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        questions = [f"How massive is Body {idx}" for idx in range(0, 100000, 500)]
+        workers = [context.Process(target=measure_worker, args=(shared.name, questions, results)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        measurements = [results.get(timeout=60) for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        segment_kib = shared.nbytes // 1024
+        for anon_growth_kib, shmem_growth_kib in measurements:
+            # Each worker's private memory grows by far less than one copy of the catalogue,
+            # because lookups read the shared segment in place.
+            self.assertLess(anon_growth_kib, segment_kib // 4, measurements)
+            self.assertGreater(shmem_growth_kib, 0, measurements)
+
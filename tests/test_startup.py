@@ -0,0 +1,30 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from src.main import CatalogueLoader
+from src.utils.errors import PlanetError
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestStartup(unittest.TestCase):
+    def test_heavy_modules_are_not_imported_at_startup(self) -> None:
+        # A fresh interpreter, since this test process has already imported everything.
+        lazy = ["difflib", "concurrent.futures", "mmap", "multiprocessing", "src.services.tabular_loader", "tracemalloc"]
+        check = f"import sys, src.main; print(' '.join(m for m in {lazy!r} if m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", check], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), [])
+
+    def test_background_loader(self) -> None:
+        catalogue = CatalogueLoader(str(PROJECT_ROOT / "data" / "planets.json")).result()
+        self.assertTrue(catalogue.exists("saturn"))
+
+        loader = CatalogueLoader(str(PROJECT_ROOT / "data" / "missing.json"))
+        with self.assertRaises(PlanetError):
+            loader.result()
+
+
+if __name__ == "__main__":
+    unittest.main()
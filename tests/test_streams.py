@@ -0,0 +1,112 @@
+import bz2
+import gc
+import gzip
+import io
+import json
+import lzma
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from unittest import mock
+
+from src.services.catalogue import PlanetCatalogue
+from src.utils import streams
+from src.utils.errors import DataValidationError
+from src.utils.streams import iter_json_array, iter_json_lines, open_decompressed
+
+PLANETS = [
+    {"name": "Earth", "mass_kg": 5.972e24, "distance_from_sun_km": 149600000, "moons": ["Moon"]},
+    {"name": "Mars", "mass_kg": 6.417e23, "distance_from_sun_km": 227900000, "moons": ["Phobos", "Deimos"]},
+]
+
+
+class TestStreams(unittest.TestCase):
+    def test_from_json_reads_compressed_files(self) -> None:
+        raw = json.dumps(PLANETS).encode("utf-8")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Misleading suffixes on purpose: the format must come from the magic bytes.
+            for name, data in [
+                ("gz.json", gzip.compress(raw)),
+                ("bz2.json", bz2.compress(raw)),
+                ("xz.json", lzma.compress(raw)),
+            ]:
+                path = Path(tmpdir) / name
+                path.write_bytes(data)
+
+                catalogue = PlanetCatalogue.from_json(path)
+                self.assertEqual(catalogue.all_names(), ["Earth", "Mars"])
+
+    def test_from_json_reads_compressed_json_lines(self) -> None:
+        raw = "\n".join(json.dumps(item) for item in PLANETS) + "\n\n"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "planets.jsonl.xz"
+            path.write_bytes(lzma.compress(raw.encode("utf-8")))
+
+            catalogue = PlanetCatalogue.from_json(path)
+            self.assertEqual(catalogue.get("mars").moon_count(), 2)
+
+    def test_values_split_across_chunks(self) -> None:
+        data = json.dumps([1.5e3, {"a": "x" * 10}, 12345678]).encode("utf-8")
+
+        with mock.patch.object(streams, "_CHUNK_SIZE", 3):
+            values = list(iter_json_array(io.BytesIO(data), "test"))
+
+        self.assertEqual(values, [1.5e3, {"a": "x" * 10}, 12345678])
+
+    def test_invalid_json_raises(self) -> None:
+        for text in ["", "[1, 2", "[1 2]", "[1] x", '{"name": "Earth"}']:
+            with self.assertRaises(DataValidationError):
+                list(iter_json_array(io.BytesIO(text.encode("utf-8")), "test"))
+
+    def test_corrupt_gzip_raises(self) -> None:
+        data = gzip.compress(json.dumps(PLANETS).encode("utf-8"))[:-20]
+
+        with self.assertRaises(DataValidationError):
+            list(iter_json_array(open_decompressed(io.BytesIO(data)), "test"))
+
+    def test_corrupt_deflate_payload_raises(self) -> None:
+        data = bytearray(gzip.compress(json.dumps(PLANETS).encode("utf-8")))
+        data[10] ^= 0xFF  # first byte after the gzip header: zlib itself rejects the stream
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "planets.json.gz"
+            path.write_bytes(bytes(data))
+
+            with self.assertRaises(DataValidationError):
+                PlanetCatalogue.from_json(path)
+
+    def test_caller_stream_stays_open(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "planets.json"
+            path.write_text(json.dumps(PLANETS), encoding="utf-8")
+            lines = Path(tmpdir) / "planets.jsonl"
+            lines.write_text("\n".join(json.dumps(item) for item in PLANETS), encoding="utf-8")
+
+            for reader, source in [(iter_json_array, path), (iter_json_lines, lines)]:
+                with warnings.catch_warnings(record=True) as caught, source.open("rb") as handle:
+                    warnings.simplefilter("always", ResourceWarning)
+                    self.assertEqual(len(list(reader(handle, str(source)))), 2)
+                    gc.collect()  # a text wrapper left attached would close the handle when collected
+                    self.assertFalse(handle.closed, reader.__name__)
+                self.assertEqual([str(warning.message) for warning in caught], [], reader.__name__)
+
+    def test_decompressor_is_closed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "planets.json.gz"
+            path.write_bytes(gzip.compress(json.dumps(PLANETS).encode("utf-8")))
+
+            # Keep a reference, so the reader is not simply closed by being garbage collected.
+            opened = []
+
+            def keep(stream):
+                opened.append(open_decompressed(stream))
+                return opened[-1]
+
+            with mock.patch("src.services.catalogue.open_decompressed", side_effect=keep):
+                PlanetCatalogue.from_json(path)
+
+            self.assertIsInstance(opened[0], gzip.GzipFile)
+            self.assertTrue(opened[0].closed)
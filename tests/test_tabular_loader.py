@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.services.catalogue import PlanetCatalogue
+from src.services.tabular_loader import CsvSpec, FixedWidthSpec
+from src.utils.errors import DataValidationError
+
+FIXED_SPEC = FixedWidthSpec(name=(0, 10), mass_kg=(10, 22), distance_from_sun_km=(22, 34), moons=(34, 60), skip_lines=1)
+
+
+class TestTabularLoader(unittest.TestCase):
+    def write(self, tmpdir: str, name: str, text: str) -> Path:
+        path = Path(tmpdir) / name
+        path.write_bytes(text.encode("utf-8"))
+        return path
+
+    def test_fixed_width_loads(self) -> None:
+        lines = [
+            "NAME      MASS        DISTANCE    MOONS",
+            "Ceres     9.38e20     4.14e8      ",
+            "Pluto     1.303e22    5.9e9       Charon; Nix;Hydra",
+            "   \t ",
+            "",
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self.write(tmpdir, "minor.txt", "\r\n".join(lines))
+            catalogue = PlanetCatalogue.from_fixed_width(path, FIXED_SPEC)
+
+            self.assertEqual(catalogue.all_names(), ["Ceres", "Pluto"])
+            self.assertEqual(catalogue.get("pluto").moons, ["Charon", "Nix", "Hydra"])
+            self.assertEqual(catalogue.get("ceres").mass_kg, 9.38e20)
+
+    def test_csv_loads_by_header_name(self) -> None:
+        text = "id,distance,name,mass,moons\n1,4.14e8,Ceres,9.38e20,\n  \n2,5.9e9,Pluto,1.303e22,Charon;Nix\n"
+        spec = CsvSpec(name="name", mass_kg="mass", distance_from_sun_km="distance", moons="moons")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            catalogue = PlanetCatalogue.from_csv(self.write(tmpdir, "minor.csv", text), spec)
+
+            self.assertEqual(catalogue.get("pluto").moon_count(), 2)
+            self.assertEqual(catalogue.get("ceres").distance_from_sun_km, 4.14e8)
+
+    def test_csv_by_index_without_header(self) -> None:
+        spec = CsvSpec(name=0, mass_kg=1, distance_from_sun_km=2, delimiter="|", has_header=False)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            catalogue = PlanetCatalogue.from_csv(self.write(tmpdir, "minor.psv", "Eris|1.66e22|1.0e10"), spec)
+            self.assertTrue(catalogue.exists("ERIS"))
+
+    def test_invalid_line_names_line_number(self) -> None:
+        text = "name,mass,distance\nCeres,9.38e20,4.14e8\nPluto,heavy,5.9e9\n"
+        spec = CsvSpec(name="name", mass_kg="mass", distance_from_sun_km="distance")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(DataValidationError) as ctx:
+                PlanetCatalogue.from_csv(self.write(tmpdir, "minor.csv", text), spec)
+            self.assertIn("line 3", str(ctx.exception))
+            self.assertEqual(str(ctx.exception).count(" line "), 1, str(ctx.exception))
+
+    def test_non_finite_numbers_raise(self) -> None:
+        spec = CsvSpec(name="name", mass_kg="mass", distance_from_sun_km="distance")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for row in ["Ceres,inf,4.14e8", "Ceres,9.38e20,nan"]:
+                with self.assertRaises(DataValidationError):
+                    PlanetCatalogue.from_csv(self.write(tmpdir, "minor.csv", f"name,mass,distance\n{row}\n"), spec)
+
+    def test_missing_column_and_duplicates_raise(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self.write(tmpdir, "minor.csv", "name,mass,distance\nCeres,1,1\nceres,2,2\n")
+
+            with self.assertRaises(DataValidationError):
+                PlanetCatalogue.from_csv(path, CsvSpec(name="name", mass_kg="weight", distance_from_sun_km="distance"))
+            with self.assertRaises(DataValidationError):
+                PlanetCatalogue.from_csv(path, CsvSpec(name="name", mass_kg="mass", distance_from_sun_km="distance"))
+
+    def test_invalid_csv_spec_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self.write(tmpdir, "minor.csv", "Ceres,9.38e20,4.14e8\n")
+
+            for spec in [
+                CsvSpec(name=-3, mass_kg=1, distance_from_sun_km=2, has_header=False),
+                CsvSpec(name=0, mass_kg=1, distance_from_sun_km=2, delimiter="", has_header=False),
+            ]:
+                with self.assertRaises(DataValidationError):
+                    PlanetCatalogue.from_csv(path, spec)
+
+    def test_empty_file_gives_empty_catalogue(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            catalogue = PlanetCatalogue.from_fixed_width(self.write(tmpdir, "empty.txt", ""), FIXED_SPEC)
+            self.assertEqual(catalogue.all_names(), [])
@@ -0,0 +1,50 @@
+import unittest
+
+from src.models.planet import Planet
+from src.services.query_parser import QueryEngine
+from src.services.versioned_catalogue import VersionedCatalogue
+from src.utils.errors import DataValidationError, PlanetNotFoundError
+
+
+def saturn(moons: list) -> Planet:
+    return Planet(name="Saturn", mass_kg=5.683e26, distance_from_sun_km=1433500000, moons=moons)
+
+
+class TestVersionedCatalogue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.earth = Planet(name="Earth", mass_kg=5.972e24, distance_from_sun_km=149600000, moons=["Moon"])
+        self.versions = VersionedCatalogue()
+        self.versions.commit("2019", [self.earth, saturn(["Titan"])])
+        self.versions.commit("2024", [saturn(["Titan", "Rhea"])])
+
+    def test_old_versions_stay_queryable(self) -> None:
+        self.assertEqual(self.versions.at("2019").get("saturn").moon_count(), 1)
+        self.assertEqual(self.versions.at("2024").get("saturn").moon_count(), 2)
+        self.assertIs(self.versions.at("2019").get("earth"), self.versions.at("2024").get("earth"))
+
+        answer = QueryEngine().answer("How many moons does Saturn have", self.versions.at("2019"))
+        self.assertIn("Saturn has 1 moon", answer)
+
+    def test_removals_and_suggestions(self) -> None:
+        self.versions.commit("2025", removals=["EARTH"])
+
+        self.assertFalse(self.versions.latest().exists("earth"))
+        self.assertTrue(self.versions.at("2024").exists("earth"))
+        self.assertEqual(self.versions.at("2024").suggest("saturnn"), ["Saturn"])
+        self.assertEqual(self.versions.labels(), ["2019", "2024", "2025"])
+
+        with self.assertRaises(PlanetNotFoundError):
+            self.versions.commit("2026", removals=["pluto"])
+
+    def test_commit_catalogue_keeps_unchanged_planets(self) -> None:
+        earth_copy = Planet(name="Earth", mass_kg=5.972e24, distance_from_sun_km=149600000, moons=["Moon"])
+        release = self.versions.commit_catalogue("2030", [earth_copy])
+
+        self.assertIs(release.get("earth"), self.earth)
+        self.assertEqual(release.all_names(), ["Earth"])
+
+    def test_duplicate_or_unknown_label_raises(self) -> None:
+        with self.assertRaises(DataValidationError):
+            self.versions.commit("2019")
+        with self.assertRaises(DataValidationError):
+            self.versions.at("1999")